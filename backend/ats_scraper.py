@@ -19,10 +19,13 @@ import argparse
 import asyncio
 import logging
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Callable
 
 import aiohttp
+import orjson
 
 try:
     from dotenv import load_dotenv
@@ -30,11 +33,19 @@ try:
 except ImportError:
     pass
 
+try:
+    import uvloop
+except ImportError:  # optional speedup, unavailable on Windows
+    uvloop = None
+
 from config import (
     LOG_FORMAT,
     LOG_LEVEL,
+    REQUEST_HEADERS,
     SCRAPE_CONCURRENCY,
+    SCRAPE_CONCURRENCY_PER_HOST,
     SCRAPE_TIMEOUT,
+    url_hostname,
 )
 import db
 from parsers import ParsedJob
@@ -73,11 +84,53 @@ PARSERS: dict[str, Any] = {
     "freshteam": freshteam_parser,
 }
 
+# parse_jobs resolved once per ATS rather than per response
+PARSE_FNS: dict[str, Callable[[Any, str], list[ParsedJob]]] = {
+    name: module.parse_jobs for name, module in PARSERS.items()
+}
+
+# scrape_company errors that are expected and not worth a warning
+_SILENT_ERRORS = frozenset({"no api_url"})
+
+# Parsed jobs are buffered and flushed to the DB once this many are pending
+INSERT_BATCH_SIZE = 500
+
+
+def _job_rows(
+    company: dict[str, Any],
+    company_id: str,
+    parsed_jobs: list[ParsedJob],
+) -> list[dict[str, Any]]:
+    """Convert one company's parsed jobs into rows for db.batch_insert_jobs."""
+    company_name = company.get("name")
+    ats_source = company.get("ats") or "unknown"
+    return [
+        {
+            "url": job.url,
+            "title": job.title,
+            "ats_source": ats_source,
+            "company_name": company_name,
+            "company_id": company_id,
+            "location": job.location,
+            "description": job.description,
+            "salary_min": job.salary_min,
+            "salary_max": job.salary_max,
+            "remote_type": job.remote_type,
+            "seniority": job.seniority,
+            "category": job.category,
+            "tags": job.tags,
+            "posted_at": job.posted_at,
+            "raw_data": job.raw_data,
+        }
+        for job in parsed_jobs
+    ]
+
 
 async def scrape_company(
     session: aiohttp.ClientSession,
     company: dict[str, Any],
     semaphore: asyncio.Semaphore,
+    host_semaphore: asyncio.Semaphore,
 ) -> tuple[str, str, list[ParsedJob], str | None]:
     company_id: str = company["id"]
     slug: str = company["slug"]
@@ -87,23 +140,25 @@ async def scrape_company(
     if not api_url:
         return company_id, slug, [], "no api_url"
 
-    parser = PARSERS.get(ats)
-    if not parser:
+    parse = PARSE_FNS.get(ats)
+    if parse is None:
         return company_id, slug, [], f"no parser for {ats}"
 
-    async with semaphore:
+    # Take the host slot first so requests queued behind a busy host don't
+    # sit on global slots other hosts could use.
+    async with host_semaphore, semaphore:
         try:
             async with session.get(
                 api_url,
                 timeout=aiohttp.ClientTimeout(total=SCRAPE_TIMEOUT),
-                headers={"Accept": "application/json"},
             ) as resp:
                 if resp.status == 200:
+                    body = await resp.read()
                     try:
-                        data = await resp.json(content_type=None)
-                    except Exception as e:
+                        data = orjson.loads(body)
+                    except orjson.JSONDecodeError as e:
                         return company_id, slug, [], f"json decode error: {e}"
-                    jobs = parser.parse_jobs(data, slug)
+                    jobs = parse(data, slug)
                     return company_id, slug, jobs, None
                 elif resp.status == 404:
                     return company_id, slug, [], None
@@ -136,12 +191,10 @@ async def run_scraper(
         logger.warning("No companies to scrape")
         return
 
-    ats_counts: dict[str, int] = {}
-    for c in companies:
-        ats_counts[c["ats"]] = ats_counts.get(c["ats"], 0) + 1
+    ats_counts = Counter(c["ats"] for c in companies)
 
     logger.info("Scraping %d companies across %d ATS platforms", len(companies), len(ats_counts))
-    for ats, count in sorted(ats_counts.items(), key=lambda x: -x[1]):
+    for ats, count in ats_counts.most_common():
         logger.info("  %s: %d companies", ats, count)
 
     run_id: str | None = None
@@ -151,91 +204,105 @@ async def run_scraper(
             config={"ats_filter": ats_filter, "company_count": len(companies)},
         )
 
-    # Fetch all jobs concurrently
+    # Fetch concurrently and hand jobs to a DB worker thread as companies
+    # finish, so inserts overlap with requests still in flight.
     start_time = time.monotonic()
     semaphore = asyncio.Semaphore(SCRAPE_CONCURRENCY)
-    connector = aiohttp.TCPConnector(limit=SCRAPE_CONCURRENCY, limit_per_host=3)
-
-    async with aiohttp.ClientSession(connector=connector) as session:
-        tasks = [scrape_company(session, c, semaphore) for c in companies]
-        results = await asyncio.gather(*tasks)
+    connector = aiohttp.TCPConnector(
+        limit=SCRAPE_CONCURRENCY,
+        limit_per_host=SCRAPE_CONCURRENCY_PER_HOST,
+        ttl_dns_cache=600,
+    )
+    company_map = {c["id"]: c for c in companies}
 
-    fetch_time = time.monotonic() - start_time
-    logger.info("API fetching done in %.1fs", fetch_time)
+    # A single worker keeps writes ordered and on one Supabase client; it
+    # only exists to keep the sync client off the event loop.
+    loop = asyncio.get_running_loop()
+    db_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db")
+    inserts: list[asyncio.Future[tuple[int, int]]] = []
 
-    # Collect all jobs into a flat list for batch insert
-    all_jobs: list[dict[str, Any]] = []
+    pending: list[dict[str, Any]] = []
+    job_counts: dict[str, int] = {}
+    total_jobs = 0
     error_count = 0
-    companies_with_jobs = 0
-    company_map = {c["id"]: c for c in companies}
 
-    for company_id, slug, parsed_jobs, error in results:
-        if error:
-            error_count += 1
-            if error not in ("no api_url",) and "404" not in str(error):
-                logger.warning("Error scraping %s: %s", slug, error)
-            continue
-
-        if not parsed_jobs:
-            continue
-
-        companies_with_jobs += 1
-        company_info = company_map.get(company_id, {})
-        company_name = company_info.get("name")
-        ats_source = company_info.get("ats") or "unknown"
-
-        for job in parsed_jobs:
-            all_jobs.append({
-                "url": job.url,
-                "title": job.title,
-                "ats_source": ats_source,
-                "company_name": company_name,
-                "company_id": company_id,
-                "location": job.location,
-                "description": job.description,
-                "salary_min": job.salary_min,
-                "salary_max": job.salary_max,
-                "remote_type": job.remote_type,
-                "seniority": job.seniority,
-                "category": job.category,
-                "tags": job.tags,
-                "posted_at": job.posted_at,
-                "raw_data": job.raw_data,
-            })
-
-    logger.info("Total jobs parsed: %d from %d companies", len(all_jobs), companies_with_jobs)
+    async with aiohttp.ClientSession(connector=connector, headers=REQUEST_HEADERS) as session:
+        # Shared ATS hosts (boards-api.greenhouse.io, api.lever.co) each get
+        # their own cap on top of the global one.
+        host_semaphores: dict[str, asyncio.Semaphore] = {}
+        tasks = []
+        for c in companies:
+            host = url_hostname(c.get("api_url") or "")
+            if host not in host_semaphores:
+                host_semaphores[host] = asyncio.Semaphore(SCRAPE_CONCURRENCY_PER_HOST)
+            tasks.append(scrape_company(session, c, semaphore, host_semaphores[host]))
+        for next_result in asyncio.as_completed(tasks):
+            company_id, slug, parsed_jobs, error = await next_result
+
+            if error:
+                error_count += 1
+                if error not in _SILENT_ERRORS:
+                    logger.warning("Error scraping %s: %s", slug, error)
+                continue
+
+            if not parsed_jobs:
+                continue
+
+            job_counts[company_id] = len(parsed_jobs)
+            total_jobs += len(parsed_jobs)
+            if dry_run:
+                continue
+
+            pending.extend(_job_rows(company_map.get(company_id, {}), company_id, parsed_jobs))
+            if len(pending) >= INSERT_BATCH_SIZE:
+                inserts.append(loop.run_in_executor(db_pool, db.batch_insert_jobs, pending))
+                pending = []
+
+    fetch_time = time.monotonic() - start_time
+    logger.info("API fetching done in %.1fs", fetch_time)
+    logger.info("Total jobs parsed: %d from %d companies", total_jobs, len(job_counts))
 
     if dry_run:
-        logger.info("[DRY RUN] Would insert/update %d jobs", len(all_jobs))
+        db_pool.shutdown()
+        logger.info("[DRY RUN] Would insert/update %d jobs", total_jobs)
         return
 
-    # Batch insert
-    insert_start = time.monotonic()
-    new_count, existing_count = db.batch_insert_jobs(all_jobs)
-    insert_time = time.monotonic() - insert_start
+    if pending:
+        inserts.append(loop.run_in_executor(db_pool, db.batch_insert_jobs, pending))
 
     # Update company metadata in batch
     now = datetime.now(timezone.utc).isoformat()
-    for company_id, slug, parsed_jobs, error in results:
-        if parsed_jobs:
-            db.update_company(company_id, {
-                "last_scraped_at": now,
-                "job_count": len(parsed_jobs),
-                "verified": True,
-            })
+    metadata_done = loop.run_in_executor(db_pool, db.update_companies, [
+        {
+            "id": company_id,
+            "slug": company_map[company_id]["slug"],
+            "ats": company_map[company_id]["ats"],
+            "last_scraped_at": now,
+            "job_count": job_count,
+            "verified": True,
+        }
+        for company_id, job_count in job_counts.items()
+    ])
+    insert_results = await asyncio.gather(*inserts)
+    await metadata_done
+    insert_time = time.monotonic() - start_time - fetch_time
+    db_pool.shutdown()
+
+    new_count = sum(new for new, _ in insert_results)
+    existing_count = sum(existing for _, existing in insert_results)
 
     elapsed = time.monotonic() - start_time
 
     logger.info("=== SCRAPE COMPLETE ===")
-    logger.info("Total time: %.1fs (fetch: %.1fs, insert: %.1fs)", elapsed, fetch_time, insert_time)
-    logger.info("Companies: %d scraped / %d total", companies_with_jobs, len(companies))
+    logger.info("Total time: %.1fs (fetch: %.1fs, insert tail: %.1fs)", elapsed, fetch_time, insert_time)
+    logger.info("Companies: %d scraped / %d total", len(job_counts), len(companies))
     logger.info("Jobs: %d new, %d existing, %d errors", new_count, existing_count, error_count)
     logger.info("Total jobs in DB: %d", db.get_job_count(active_only=False))
 
     if run_id:
         db.finish_scrape_run(
             run_id=run_id,
-            total_found=len(all_jobs),
+            total_found=total_jobs,
             new_found=new_count,
             errors=error_count,
             status="completed",
@@ -252,7 +319,8 @@ def main() -> None:
 
     args = parser.parse_args()
 
-    asyncio.run(run_scraper(
+    run = uvloop.run if uvloop is not None else asyncio.run
+    run(run_scraper(
         ats_filter=args.ats,
         company_filter=args.company,
         limit=args.limit,
@@ -38,7 +38,7 @@ def run_cleanup(dry_run: bool = False) -> None:
     # 1. Mark stale jobs inactive
     logger.info("Marking jobs inactive if last_seen > %dh ago...", JOB_STALE_HOURS)
     if dry_run:
-        stale = db.get_client().table("jobs").select("id", count="exact").eq("is_active", True).lt(
+        stale = db.get_client().table("jobs").select("id", count="exact", head=True).eq("is_active", True).lt(
             "last_seen",
             _cutoff_iso(hours=JOB_STALE_HOURS),
         ).execute()
@@ -50,7 +50,7 @@ def run_cleanup(dry_run: bool = False) -> None:
     # 2. Delete old jobs
     logger.info("Deleting jobs older than %d days...", JOB_TTL_DAYS)
     if dry_run:
-        old = db.get_client().table("jobs").select("id", count="exact").lt(
+        old = db.get_client().table("jobs").select("id", count="exact", head=True).lt(
             "first_seen",
             _cutoff_iso(days=JOB_TTL_DAYS),
         ).execute()
@@ -60,8 +60,10 @@ def run_cleanup(dry_run: bool = False) -> None:
         old_count = db.delete_old_jobs(days=JOB_TTL_DAYS)
 
     # 3. Summary
-    total_jobs = db.get_job_count(active_only=False)
-    active_jobs = db.get_job_count(active_only=True)
+    total_jobs, active_jobs = db.fetch_concurrently(
+        lambda: db.get_job_count(active_only=False),
+        lambda: db.get_job_count(active_only=True),
+    )
 
     logger.info("=== CLEANUP COMPLETE ===")
     logger.info("Stale jobs marked inactive: %d", stale_count)
@@ -5,7 +5,10 @@ Environment variables and constants for all backend workers.
 
 import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
+from typing import Callable
+from urllib.parse import urlparse
 
 # ---------------------------------------------------------------------------
 # Environment
@@ -32,15 +35,36 @@ DATA_DIR: Path = PROJECT_ROOT / "data"  # where JSON result files live
 # ---------------------------------------------------------------------------
 
 SCRAPE_CONCURRENCY: int = int(os.environ.get("SCRAPE_CONCURRENCY", "20"))
+SCRAPE_CONCURRENCY_PER_HOST: int = int(os.environ.get("SCRAPE_CONCURRENCY_PER_HOST", "8"))
 SCRAPE_TIMEOUT: int = int(os.environ.get("SCRAPE_TIMEOUT", "10"))
 SCRAPE_RATE_LIMIT_PER_ATS: float = 1.0  # seconds between requests to same ATS domain
 
+# Sent on every outbound ATS / discovery request
+USER_AGENT: str = "sykr-scraper/1.0 (+https://jobsekr.app)"
+
+# aiohttp only decodes br when a Brotli package is importable, so only ask for it then
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip, deflate"
+
+# Session-level default headers for every scraper / discovery session
+REQUEST_HEADERS: dict[str, str] = {
+    "Accept": "application/json",
+    "Accept-Encoding": _ACCEPT_ENCODING,
+    "User-Agent": USER_AGENT,
+}
+
 # Jobs older than this are pruned by cleanup.py
 JOB_TTL_DAYS: int = 90
 
 # Jobs not seen for this long are marked inactive
 JOB_STALE_HOURS: int = 48
 
+# Unverified companies probed more recently than this are skipped by discovery
+PROBE_RECHECK_HOURS: int = 24
+
 # ---------------------------------------------------------------------------
 # ATS API URL Templates
 # ---------------------------------------------------------------------------
@@ -97,6 +121,76 @@ ATS_DOMAIN_MAP: dict[str, str] = {
     "linkedin.com":             "linkedin",
 }
 
+# ATS_DOMAIN_MAP ordered most specific first, so "boards.greenhouse.io"
+# matches before "greenhouse.io". Sorted once here instead of per URL.
+ATS_DOMAINS_BY_SPECIFICITY: tuple[tuple[str, str], ...] = tuple(
+    sorted(ATS_DOMAIN_MAP.items(), key=lambda x: -len(x[0]))
+)
+
+
+def url_hostname(url: str) -> str:
+    """
+    Lowercased hostname of `url`, like ``urlparse(url).hostname or ""``
+    but by slicing, without building a ParseResult. Unusual inputs
+    (IPv6 literals, zone ids, ;params, tabs or newlines, missing or
+    unusual scheme) fall back to urlparse.
+    """
+    return url_host_path(url)[0]
+
+
+def url_host_path(url: str) -> tuple[str, str]:
+    """
+    (lowercased hostname, path) of `url`, sliced the same way as
+    url_hostname. The path keeps its leading slash, like ParseResult.path.
+    """
+    start = url.find("://")
+    if start <= 0 or not url[:start].isalpha() or _has_unsafe_bytes(url):
+        return _urlparse_host_path(url)
+    start += 3
+    end = len(url)
+    for sep in "/?#":
+        i = url.find(sep, start, end)
+        if i >= 0:
+            end = i
+    netloc = url[start:end]
+    if "[" in netloc or "]" in netloc or "%" in netloc:
+        return _urlparse_host_path(url)
+    path_end = len(url)
+    for sep in "?#":
+        i = url.find(sep, end, path_end)
+        if i >= 0:
+            path_end = i
+    path = url[end:path_end]
+    if ";" in path:
+        # urlparse splits ;params off the last path segment
+        return _urlparse_host_path(url)
+    return netloc.rpartition("@")[2].partition(":")[0].lower(), path
+
+
+def _has_unsafe_bytes(url: str) -> bool:
+    # urlparse silently deletes these wherever they appear
+    return "\t" in url or "\r" in url or "\n" in url
+
+
+def _urlparse_host_path(url: str) -> tuple[str, str]:
+    try:
+        parsed = urlparse(url)
+        return parsed.hostname or "", parsed.path
+    except ValueError:
+        return "", ""
+
+
+@lru_cache(maxsize=4096)
+def detect_ats_domain(hostname: str) -> str | None:
+    """Return the ATS whose most specific domain is contained in `hostname`.
+
+    Cached, since scrape results repeat the same few hundred hosts.
+    """
+    for domain, ats in ATS_DOMAINS_BY_SPECIFICITY:
+        if domain in hostname:
+            return ats
+    return None
+
 # ---------------------------------------------------------------------------
 # URL Patterns for Slug Extraction
 # ---------------------------------------------------------------------------
@@ -143,6 +237,51 @@ SLUG_PATTERNS: list[SlugPattern] = [
     SlugPattern("freshteam", "freshteam.com", "subdomain"),
 ]
 
+# Extracts a raw slug from (lowercased hostname, non-empty path segments)
+SlugExtractor = Callable[[str, list[str]], "str | None"]
+
+
+def _compile_slug_strategy(pattern: SlugPattern) -> SlugExtractor:
+    """Turn a SlugPattern strategy string into an extractor function."""
+    kind, _, arg = pattern.strategy.partition(":")
+
+    if kind == "path":
+        idx = int(arg)
+
+        def from_path(hostname: str, path_parts: list[str]) -> str | None:
+            return path_parts[idx] if len(path_parts) > idx else None
+        return from_path
+
+    if kind == "subdomain":
+        # e.g., stripe.recruitee.com → "stripe", as long as the ATS label
+        # ("recruitee") isn't itself the leftmost one
+        domain_base = pattern.domain_contains.split(".")[0]
+
+        def from_subdomain(hostname: str, path_parts: list[str]) -> str | None:
+            labels = hostname.split(".")
+            if domain_base in labels and labels.index(domain_base) > 0:
+                return labels[0]
+            return None
+        return from_subdomain
+
+    if kind == "path_after":
+        marker = arg
+
+        def from_path_after(hostname: str, path_parts: list[str]) -> str | None:
+            for i, part in enumerate(path_parts[:-1]):
+                if part.lower() == marker:
+                    return path_parts[i + 1]
+            return None
+        return from_path_after
+
+    raise ValueError(f"Unknown slug strategy {pattern.strategy!r} for {pattern.ats}")
+
+
+# (ats, domain_contains, extractor) with every strategy parsed once at import
+COMPILED_SLUG_PATTERNS: list[tuple[str, str, SlugExtractor]] = [
+    (p.ats, p.domain_contains, _compile_slug_strategy(p)) for p in SLUG_PATTERNS
+]
+
 # ---------------------------------------------------------------------------
 # Discovery Sources
 # ---------------------------------------------------------------------------
@@ -6,13 +6,20 @@ Uses service_role key — bypasses RLS (backend only, never expose to frontend).
 
 from __future__ import annotations
 
+import atexit
 import hashlib
 import logging
 import re
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any
+from functools import lru_cache
+from typing import Any, Callable
 from urllib.parse import urlparse, urlunparse
 
+import httpx
 from supabase import create_client, Client
 
 from config import SUPABASE_URL, SUPABASE_SERVICE_KEY
@@ -20,54 +27,124 @@ from config import SUPABASE_URL, SUPABASE_SERVICE_KEY
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
-# Client singleton
+# Client (one per thread)
 # ---------------------------------------------------------------------------
+# Writers and concurrent reads run on worker threads. Each thread gets its own
+# client and request counter, so resets never race and threads don't share
+# one keep-alive pool.
 
-_client: Client | None = None
-_request_count: int = 0
+_local = threading.local()
 _MAX_REQUESTS_BEFORE_RESET: int = 5000
 
 
 def get_client() -> Client:
-    """Return a Supabase client (service_role). Resets connection periodically."""
-    global _client, _request_count
-    if _client is None or _request_count >= _MAX_REQUESTS_BEFORE_RESET:
-        if _client is not None:
-            logger.info("Resetting Supabase client after %d requests", _request_count)
+    """Return this thread's Supabase client (service_role). Resets connection periodically."""
+    client: Client | None = getattr(_local, "client", None)
+    if client is None or _local.count >= _MAX_REQUESTS_BEFORE_RESET:
+        if client is not None:
+            logger.info("Resetting Supabase client after %d requests", _local.count)
         if not SUPABASE_URL or not SUPABASE_SERVICE_KEY:
             raise RuntimeError(
                 "SUPABASE_URL and SUPABASE_SERVICE_KEY must be set. "
                 "Create a .env file or set environment variables."
             )
-        _client = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
-        _request_count = 0
+        client = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
+        _local.client = client
+        _local.count = 0
         logger.info("Supabase client initialized for %s", SUPABASE_URL)
-    _request_count += 1
-    return _client
+    _local.count += 1
+    return client
+
+
+# Transport failures worth retrying on a fresh client
+_CONNECTION_ERRORS: tuple[type[BaseException], ...] = (
+    httpx.RemoteProtocolError,
+    httpx.ReadError,
+    httpx.WriteError,
+    httpx.ConnectError,
+    httpx.PoolTimeout,
+    ConnectionResetError,
+    ConnectionRefusedError,
+    BrokenPipeError,
+)
+
+# Message fallback for errors that arrive wrapped in another exception type
+_CONNECTION_ERROR_MARKERS: tuple[str, ...] = (
+    "connectionterminated", "remoteprotocolerror",
+    "connectionreset", "connectionrefused", "broken pipe",
+)
+
+
+def _is_connection_error(e: Exception) -> bool:
+    """Classify by exception type first; only scan the message as a fallback."""
+    if isinstance(e, _CONNECTION_ERRORS):
+        return True
+    err_str = str(e).lower()
+    return any(k in err_str for k in _CONNECTION_ERROR_MARKERS)
 
 
 def _retry(fn, retries: int = 3, delay: float = 1.0):
     """Retry a function on connection errors."""
-    import time as _time
     for attempt in range(retries):
         try:
             return fn()
         except Exception as e:
-            err_str = str(e).lower()
-            is_connection_error = any(k in err_str for k in (
-                "connectionterminated", "remoteprotocolerror",
-                "connectionreset", "connectionrefused", "broken pipe",
-            ))
-            if is_connection_error and attempt < retries - 1:
+            if attempt < retries - 1 and _is_connection_error(e):
                 logger.warning("Connection error (attempt %d/%d): %s", attempt + 1, retries, e)
-                _time.sleep(delay * (attempt + 1))
-                # Force client reset
-                global _request_count
-                _request_count = _MAX_REQUESTS_BEFORE_RESET
+                time.sleep(delay * (attempt + 1))
+                # Force this thread's client to reset
+                _local.count = _MAX_REQUESTS_BEFORE_RESET
                 continue
             raise
 
 
+# Long-lived so its threads keep their clients (and connections) between calls
+_read_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="db-read")
+
+
+def fetch_concurrently(*calls: Callable[[], Any]) -> list[Any]:
+    """Run independent zero-arg reads in parallel, returning results in order.
+
+    Each call is a blocking HTTP round trip, so issuing them together costs
+    the slowest one instead of the sum.
+    """
+    if len(calls) <= 1:
+        return [call() for call in calls]
+    futures = [_read_pool.submit(call) for call in calls]
+    return [f.result() for f in futures]
+
+
+# ---------------------------------------------------------------------------
+# Company read cache
+# ---------------------------------------------------------------------------
+# Company rows change on the scale of hours, so repeated reads within a
+# short window are served from memory. Every company write clears it.
+
+_COMPANY_CACHE_TTL: float = 60.0
+_company_cache: dict[tuple[Any, ...], tuple[float, Any]] = {}
+_company_cache_lock = threading.Lock()
+
+
+def _cached_company_read(key: tuple[Any, ...], fn):
+    """Return fn()'s result for `key`, reusing it for _COMPANY_CACHE_TTL seconds."""
+    now = time.monotonic()
+    with _company_cache_lock:
+        hit = _company_cache.get(key)
+    if hit is not None and now - hit[0] < _COMPANY_CACHE_TTL:
+        value = hit[1]
+    else:
+        value = fn()
+        with _company_cache_lock:
+            _company_cache[key] = (now, value)
+    # Hand out copies of lists so callers can't mutate the cached value
+    return list(value) if isinstance(value, list) else value
+
+
+def _invalidate_company_cache() -> None:
+    with _company_cache_lock:
+        _company_cache.clear()
+
+
 # ---------------------------------------------------------------------------
 # URL Hashing (deduplication)
 # ---------------------------------------------------------------------------
@@ -79,7 +156,42 @@ def normalize_url(url: str) -> str:
     - Strip query params and fragments
     - Strip trailing slash
     - Remove www. prefix
+
+    Plain http(s) URLs are handled with str slicing; anything unusual
+    (IPv6 hosts, params, control or non-ASCII characters, no host) goes
+    through _normalize_url_slow so the result is always the same.
     """
+    url = url.strip()
+    scheme, sep, rest = url.partition("://")
+    scheme = scheme.lower()
+    if not sep or scheme not in ("http", "https") or not (url.isascii() and url.isprintable()):
+        return _normalize_url_slow(url)
+
+    # netloc runs up to the first "/", "?" or "#"; the path up to "?" or "#"
+    end = len(rest)
+    for ch in "/?#":
+        i = rest.find(ch)
+        if i != -1 and i < end:
+            end = i
+    netloc = rest[:end]
+    path = rest[end:]
+    for ch in "?#":
+        i = path.find(ch)
+        if i != -1:
+            path = path[:i]
+
+    if "[" in netloc or "]" in netloc or "%" in netloc or ";" in path:
+        return _normalize_url_slow(url)
+    host = netloc.rpartition("@")[2].partition(":")[0].lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if not host:
+        return _normalize_url_slow(url)
+    return f"{scheme}://{host}{path.rstrip('/')}"
+
+
+def _normalize_url_slow(url: str) -> str:
+    """urllib-based normalize_url; the reference the fast path must match."""
     parsed = urlparse(url.strip())
     scheme = (parsed.scheme or "https").lower()
     host = (parsed.hostname or "").lower()
@@ -93,17 +205,20 @@ def normalize_url(url: str) -> str:
     return normalized
 
 
+_sha256 = hashlib.sha256
+
+
+@lru_cache(maxsize=65536)
 def hash_url(url: str) -> str:
     """SHA-256 hash of the normalized URL."""
-    normalized = normalize_url(url)
-    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+    return _sha256(normalize_url(url).encode("utf-8")).hexdigest()
 
 
 # ---------------------------------------------------------------------------
 # Companies
 # ---------------------------------------------------------------------------
 
-def upsert_company(
+def _prepare_company_row(
     slug: str,
     ats: str,
     name: str | None = None,
@@ -111,11 +226,8 @@ def upsert_company(
     careers_url: str | None = None,
     source: str | None = None,
     metadata: dict[str, Any] | None = None,
-) -> dict[str, Any] | None:
-    """
-    Insert or update a company by (ats, slug) unique constraint.
-    Returns the upserted row or None on error.
-    """
+) -> dict[str, Any]:
+    """Build a companies row for the upsert_companies RPC, keeping only set fields."""
     row: dict[str, Any] = {
         "slug": slug.lower().strip(),
         "ats": ats.lower().strip(),
@@ -128,51 +240,81 @@ def upsert_company(
         row["careers_url"] = careers_url.strip()
     if metadata:
         row["metadata"] = metadata
+    if source:
+        row["sources"] = [source]
+    return row
+
 
+def upsert_company(
+    slug: str,
+    ats: str,
+    name: str | None = None,
+    api_url: str | None = None,
+    careers_url: str | None = None,
+    source: str | None = None,
+    metadata: dict[str, Any] | None = None,
+) -> dict[str, Any] | None:
+    """
+    Insert or update a company by (ats, slug) unique constraint.
+    Returns the upserted row or None on error.
+    """
+    row = _prepare_company_row(slug, ats, name, api_url, careers_url, source, metadata)
+
+    # upsert_companies (migration 003) merges the source tag server-side,
+    # so this is one round trip instead of upsert + select + update.
+    _invalidate_company_cache()
     try:
-        result = (
+        result = _retry(lambda: (
             get_client()
-            .table("companies")
-            .upsert(row, on_conflict="ats,slug")
+            .rpc("upsert_companies", {"p_companies": [row]})
             .execute()
-        )
-        data = result.data
-        if data and len(data) > 0:
-            company = data[0]
-            # Append source to sources array if provided
-            if source and company.get("id"):
-                _append_source(company["id"], source)
-            return company
-        return None
+        ))
+        return result.data[0] if result.data else None
     except Exception as e:
         logger.error("Failed to upsert company %s/%s: %s", ats, slug, e)
         return None
 
 
-def _append_source(company_id: str, source: str) -> None:
-    """Append a source tag to a company's sources array (if not already present)."""
-    try:
-        # Fetch current sources
-        result = (
-            get_client()
-            .table("companies")
-            .select("sources")
-            .eq("id", company_id)
-            .single()
-            .execute()
-        )
-        current_sources: list[str] = result.data.get("sources", []) if result.data else []
-        if source not in current_sources:
-            current_sources.append(source)
-            (
+def upsert_companies(
+    companies: list[dict[str, Any]],
+    batch_size: int = 500,
+) -> list[dict[str, Any]]:
+    """
+    Bulk upsert_company: one RPC call per batch instead of one per company.
+    Each dict takes upsert_company's keyword arguments (slug and ats required).
+    Entries for the same (ats, slug) are merged first, later values winning
+    and sources appended in order, exactly as sequential calls would apply.
+    Returns the upserted rows (in no particular order).
+    """
+    merged: dict[tuple[str, str], dict[str, Any]] = {}
+    for company in companies:
+        row = _prepare_company_row(**company)
+        key = (row["ats"], row["slug"])
+        prev = merged.get(key)
+        if prev is None:
+            merged[key] = row
+            continue
+        for source in row.pop("sources", ()):
+            sources = prev.setdefault("sources", [])
+            if source not in sources:
+                sources.append(source)
+        prev.update(row)
+
+    rows = list(merged.values())
+    _invalidate_company_cache()
+    upserted: list[dict[str, Any]] = []
+    for i in range(0, len(rows), batch_size):
+        batch = rows[i:i + batch_size]
+        try:
+            result = _retry(lambda b=batch: (
                 get_client()
-                .table("companies")
-                .update({"sources": current_sources})
-                .eq("id", company_id)
+                .rpc("upsert_companies", {"p_companies": b})
                 .execute()
-            )
-    except Exception as e:
-        logger.warning("Failed to append source for company %s: %s", company_id, e)
+            ))
+            upserted.extend(result.data or [])
+        except Exception as e:
+            logger.error("Failed to upsert %d companies: %s", len(batch), e)
+    return upserted
 
 
 def get_verified_companies(ats: str | None = None) -> list[dict[str, Any]]:
@@ -187,38 +329,129 @@ def get_verified_companies(ats: str | None = None) -> list[dict[str, Any]]:
     if ats:
         query = query.eq("ats", ats.lower())
 
-    result = query.execute()
-    return result.data or []
+    return _cached_company_read(("verified", ats), lambda: query.execute().data or [])
 
 
-def get_all_companies(ats: str | None = None, limit: int = 5000) -> list[dict[str, Any]]:
-    """Fetch all companies, optionally filtered by ATS."""
+def get_all_companies(
+    ats: str | None = None,
+    limit: int = 5000,
+    stale_before: str | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Fetch all companies, optionally filtered by ATS. With `stale_before`
+    (ISO timestamp), only companies never probed or last probed before it.
+    """
     query = get_client().table("companies").select("*").limit(limit)
     if ats:
         query = query.eq("ats", ats.lower())
+    if stale_before:
+        # The cutoff moves with every call, so this read isn't cached
+        query = query.or_(f"last_probed_at.is.null,last_probed_at.lt.{stale_before}")
+        return query.execute().data or []
 
-    result = query.execute()
-    return result.data or []
+    return _cached_company_read(("all", ats, limit), lambda: query.execute().data or [])
 
 
 def update_company(company_id: str, updates: dict[str, Any]) -> None:
     """Update a company row by ID."""
+    _invalidate_company_cache()
     try:
         get_client().table("companies").update(updates).eq("id", company_id).execute()
     except Exception as e:
         logger.error("Failed to update company %s: %s", company_id, e)
 
 
+def update_companies(rows: list[dict[str, Any]], batch_size: int = 500) -> int:
+    """
+    Apply per-company updates with one upsert per batch instead of one
+    UPDATE per company. Each row carries id, slug and ats (the upsert still
+    has to satisfy the NOT NULL columns) plus the fields to change.
+    Returns the number of rows written.
+    """
+    # PostgREST sends one column list per request and fills gaps with NULL,
+    # so only rows with the same keys can share a batch.
+    _invalidate_company_cache()
+    groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+    for row in rows:
+        groups.setdefault(tuple(sorted(row)), []).append(row)
+
+    written = 0
+    for group in groups.values():
+        for i in range(0, len(group), batch_size):
+            batch = group[i:i + batch_size]
+            try:
+                _retry(lambda b=batch: (
+                    get_client()
+                    .table("companies")
+                    .upsert(b, on_conflict="id", returning="minimal")
+                    .execute()
+                ))
+                written += len(batch)
+            except Exception as e:
+                logger.error("Failed to update %d companies: %s", len(batch), e)
+    return written
+
+
 def get_company_count() -> int:
     """Return total number of companies."""
-    result = get_client().table("companies").select("id", count="exact").execute()
-    return result.count or 0
+    return _cached_company_read(("count",), lambda: (
+        get_client().table("companies").select("id", count="exact", head=True).execute().count or 0
+    ))
 
 
 # ---------------------------------------------------------------------------
 # Jobs
 # ---------------------------------------------------------------------------
 
+def _prepare_job_row(job: dict[str, Any], now: str) -> dict[str, Any]:
+    """Build a jobs row from a job dict, keeping only columns that have values."""
+    row: dict[str, Any] = {
+        "url_hash": job.get("url_hash") or hash_url(job["url"]),
+        "url": job["url"].strip(),
+        "title": job["title"].strip(),
+        "ats_source": (job.get("ats_source") or "unknown").lower().strip(),
+        "first_seen": now,
+        "last_seen": now,
+        "is_active": True,
+    }
+    if job.get("company_name"):
+        row["company_name"] = job["company_name"].strip()
+    if job.get("company_id"):
+        row["company_id"] = job["company_id"]
+    if job.get("location"):
+        loc = job["location"]
+        if isinstance(loc, str):
+            row["location"] = loc.strip()
+        elif isinstance(loc, dict):
+            row["location"] = loc.get("name", str(loc)).strip()
+        else:
+            row["location"] = str(loc).strip()
+    if job.get("description"):
+        # Store first 500 chars in description column
+        row["description"] = job["description"][:500].strip()
+    if job.get("salary_min") is not None:
+        row["salary_min"] = job["salary_min"]
+    if job.get("salary_max") is not None:
+        row["salary_max"] = job["salary_max"]
+    if job.get("remote_type") in ("remote", "onsite", "hybrid", "unknown"):
+        row["remote_type"] = job["remote_type"]
+    if job.get("seniority"):
+        row["seniority"] = job["seniority"]
+    if job.get("platform"):
+        row["platform"] = job["platform"]
+    if job.get("category"):
+        row["category"] = job["category"]
+    if job.get("tags"):
+        row["tags"] = job["tags"]
+    if job.get("easy_apply"):
+        row["easy_apply"] = True
+    if job.get("posted_at"):
+        row["posted_at"] = job["posted_at"]
+    if job.get("raw_data"):
+        row["raw_data"] = job["raw_data"]
+    return row
+
+
 def upsert_job(
     url: str,
     title: str,
@@ -237,221 +470,90 @@ def upsert_job(
     easy_apply: bool = False,
     posted_at: str | None = None,
     raw_data: dict[str, Any] | None = None,
+    now: str | None = None,
 ) -> tuple[dict[str, Any] | None, bool]:
     """
     Insert or update a job by url_hash.
     Returns (job_row, is_new) tuple.
     - is_new=True if this was an INSERT (first time seeing this URL)
     - is_new=False if this was an UPDATE (already existed, refreshed last_seen)
-    """
-    url_h = hash_url(url)
-    now = datetime.now(timezone.utc).isoformat()
-
-    # Check if job already exists
-    existing = _retry(lambda: (
-        get_client()
-        .table("jobs")
-        .select("id")
-        .eq("url_hash", url_h)
-        .execute()
-    ))
-    is_new = not existing.data or len(existing.data) == 0
-
-    if is_new:
-        row: dict[str, Any] = {
-            "url_hash": url_h,
-            "url": url.strip(),
-            "title": title.strip(),
-            "ats_source": ats_source.lower().strip(),
-            "first_seen": now,
-            "last_seen": now,
-            "is_active": True,
-        }
-        if company_name:
-            row["company_name"] = company_name.strip()
-        if company_id:
-            row["company_id"] = company_id
-        if location:
-            row["location"] = location.strip()
-        if description:
-            # Store first 500 chars in description column
-            row["description"] = description[:500].strip()
-        if salary_min is not None:
-            row["salary_min"] = salary_min
-        if salary_max is not None:
-            row["salary_max"] = salary_max
-        if remote_type and remote_type in ("remote", "onsite", "hybrid", "unknown"):
-            row["remote_type"] = remote_type
-        if seniority:
-            row["seniority"] = seniority
-        if platform:
-            row["platform"] = platform
-        if category:
-            row["category"] = category
-        if tags:
-            row["tags"] = tags
-        if easy_apply:
-            row["easy_apply"] = True
-        if posted_at:
-            row["posted_at"] = posted_at
-        if raw_data:
-            row["raw_data"] = raw_data
-
-        try:
-            result = _retry(lambda: get_client().table("jobs").insert(row).execute())
-            return (result.data[0] if result.data else None, True)
-        except Exception as e:
-            logger.error("Failed to insert job %s: %s", url[:80], e)
-            return (None, False)
-    else:
-        # Already exists — update last_seen and is_active
-        job_id = existing.data[0]["id"]
-        updates: dict[str, Any] = {
-            "last_seen": now,
-            "is_active": True,
-        }
-        # Update fields that may have changed
-        if company_id:
-            updates["company_id"] = company_id
-        if salary_min is not None:
-            updates["salary_min"] = salary_min
-        if salary_max is not None:
-            updates["salary_max"] = salary_max
 
-        try:
-            result = _retry(lambda: (
-                get_client()
-                .table("jobs")
-                .update(updates)
-                .eq("id", job_id)
-                .execute()
-            ))
-            return (result.data[0] if result.data else None, False)
-        except Exception as e:
-            logger.error("Failed to update job %s: %s", job_id, e)
+    Callers upserting jobs in a loop can pass one `now` ISO timestamp for the
+    whole run instead of formatting a fresh one per call.
+    """
+    row = _prepare_job_row({
+        "url": url,
+        "title": title,
+        "ats_source": ats_source,
+        "company_name": company_name,
+        "company_id": company_id,
+        "location": location,
+        "description": description,
+        "salary_min": salary_min,
+        "salary_max": salary_max,
+        "remote_type": remote_type,
+        "seniority": seniority,
+        "platform": platform,
+        "category": category,
+        "tags": tags,
+        "easy_apply": easy_apply,
+        "posted_at": posted_at,
+        "raw_data": raw_data,
+    }, now or datetime.now(timezone.utc).isoformat())
+
+    # One round trip: the upsert_job RPC (migration 002) inserts or refreshes
+    # last_seen/company_id/salary and reports which one happened.
+    try:
+        result = _retry(lambda: get_client().rpc("upsert_job", {"p_job": row}).execute())
+        if not result.data:
             return (None, False)
+        return (result.data[0]["job"], bool(result.data[0]["is_new"]))
+    except Exception as e:
+        logger.error("Failed to upsert job %s: %s", url[:80], e)
+        return (None, False)
 
 
 def batch_insert_jobs(jobs: list[dict[str, Any]], batch_size: int = 500) -> tuple[int, int]:
     """
-    Batch insert jobs, skipping duplicates via url_hash unique constraint.
-    Much faster than individual upserts — one request per batch.
-    Returns (new_count, skipped_count).
+    Batch upsert jobs via the upsert_jobs RPC (migration 004): one request
+    and one transaction per batch. New URLs are inserted; existing ones get
+    last_seen refreshed and company_id/salary backfilled, like upsert_job.
+    Returns (new_count, existing_count).
     """
     if not jobs:
         return 0, 0
 
-    # Pre-compute url_hashes
+    now = datetime.now(timezone.utc).isoformat()
+    # Collapse boards that list one posting twice (last copy wins) so a
+    # duplicate is neither shipped again nor counted as both new and existing
+    by_hash: dict[str, dict[str, Any]] = {}
     for job in jobs:
-        if "url_hash" not in job:
-            job["url_hash"] = hash_url(job["url"])
+        row = _prepare_job_row(job, now)
+        by_hash[row["url_hash"]] = row
+    rows = list(by_hash.values())
+    if len(rows) < len(jobs):
+        logger.debug("Dropped %d duplicate jobs from batch", len(jobs) - len(rows))
 
-    # Fetch existing hashes in one query
-    hashes = [j["url_hash"] for j in jobs]
-    existing_hashes: set[str] = set()
-
-    # Query in smaller batches to avoid URL length limits
-    for i in range(0, len(hashes), 200):
-        chunk = hashes[i:i + 200]
-        try:
-            result = _retry(lambda c=chunk: (
-                get_client()
-                .table("jobs")
-                .select("url_hash")
-                .in_("url_hash", c)
-                .execute()
-            ))
-            if result.data:
-                existing_hashes.update(r["url_hash"] for r in result.data)
-        except Exception as e:
-            logger.error("Failed to check existing hashes: %s", e)
-
-    # Filter to only new jobs
-    new_jobs = [j for j in jobs if j["url_hash"] not in existing_hashes]
-
-    if not new_jobs:
-        return 0, len(jobs)
-
-    # Update last_seen for existing jobs in one batch
-    existing_jobs = [j for j in jobs if j["url_hash"] in existing_hashes]
-    if existing_jobs:
-        now = datetime.now(timezone.utc).isoformat()
-        existing_job_hashes = [j["url_hash"] for j in existing_jobs]
-        for i in range(0, len(existing_job_hashes), 200):
-            chunk = existing_job_hashes[i:i + 200]
-            try:
-                _retry(lambda c=chunk: (
-                    get_client()
-                    .table("jobs")
-                    .update({"last_seen": now, "is_active": True})
-                    .in_("url_hash", c)
-                    .execute()
-                ))
-            except Exception as e:
-                logger.warning("Failed to update last_seen batch: %s", e)
-
-    # Insert new jobs in batches using upsert to handle any remaining dupes
     new_count = 0
-    now = datetime.now(timezone.utc).isoformat()
-
-    for i in range(0, len(new_jobs), batch_size):
-        batch = new_jobs[i:i + batch_size]
-        rows = []
-        for job in batch:
-            row: dict[str, Any] = {
-                "url_hash": job["url_hash"],
-                "url": job["url"].strip(),
-                "title": job["title"].strip(),
-                "ats_source": job.get("ats_source", "unknown").lower().strip(),
-                "first_seen": now,
-                "last_seen": now,
-                "is_active": True,
-            }
-            if job.get("company_name"):
-                row["company_name"] = job["company_name"].strip()
-            if job.get("company_id"):
-                row["company_id"] = job["company_id"]
-            if job.get("location"):
-                loc = job["location"]
-                if isinstance(loc, str):
-                    row["location"] = loc.strip()
-                elif isinstance(loc, dict):
-                    row["location"] = loc.get("name", str(loc)).strip()
-                else:
-                    row["location"] = str(loc).strip()
-            if job.get("description"):
-                row["description"] = job["description"][:500].strip()
-            if job.get("salary_min") is not None:
-                row["salary_min"] = job["salary_min"]
-            if job.get("salary_max") is not None:
-                row["salary_max"] = job["salary_max"]
-            if job.get("remote_type") and job["remote_type"] in ("remote", "onsite", "hybrid", "unknown"):
-                row["remote_type"] = job["remote_type"]
-            if job.get("seniority"):
-                row["seniority"] = job["seniority"]
-            if job.get("category"):
-                row["category"] = job["category"]
-            if job.get("tags"):
-                row["tags"] = job["tags"]
-            if job.get("posted_at"):
-                row["posted_at"] = job["posted_at"]
-            if job.get("raw_data"):
-                row["raw_data"] = job["raw_data"]
-            rows.append(row)
-
+    existing_count = 0
+    for i in range(0, len(rows), batch_size):
+        batch = rows[i:i + batch_size]
         try:
-            result = _retry(lambda r=rows: (
+            result = _retry(lambda r=batch: (
                 get_client()
-                .table("jobs")
-                .upsert(r, on_conflict="url_hash", ignore_duplicates=True)
+                .rpc("upsert_jobs", {"p_jobs": r})
                 .execute()
             ))
-            new_count += len(result.data) if result.data else 0
+            for rec in result.data or []:
+                if rec["is_new"]:
+                    new_count += 1
+                else:
+                    existing_count += 1
         except Exception as e:
             logger.error("Batch upsert failed: %s", e)
 
-    logger.info("Batch insert: %d new, %d existing (updated last_seen)", new_count, len(existing_jobs))
-    return new_count, len(existing_jobs)
+    logger.info("Batch insert: %d new, %d existing (refreshed)", new_count, existing_count)
+    return new_count, existing_count
 
 
 def mark_stale_jobs(ats_source: str, active_url_hashes: set[str]) -> int:
@@ -482,7 +584,7 @@ def mark_stale_jobs(ats_source: str, active_url_hashes: set[str]) -> int:
 
 def get_job_count(active_only: bool = True) -> int:
     """Return total number of jobs."""
-    query = get_client().table("jobs").select("id", count="exact")
+    query = get_client().table("jobs").select("id", count="exact", head=True)
     if active_only:
         query = query.eq("is_active", True)
     result = query.execute()
@@ -493,13 +595,22 @@ def get_job_count(active_only: bool = True) -> int:
 # Scrape Runs
 # ---------------------------------------------------------------------------
 
+# Run bookkeeping is written in the background so workers never wait on it.
+# One thread keeps each run's insert ahead of its finish update; pending
+# writes are flushed at interpreter exit.
+_writer_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-writer")
+atexit.register(_writer_pool.shutdown, wait=True)
+
+
 def start_scrape_run(
     source: str,
     job_title: str | None = None,
     config: dict[str, Any] | None = None,
 ) -> str:
-    """Create a new scrape_run record. Returns the run ID."""
+    """Queue a new scrape_run record. Returns the (client-generated) run ID."""
+    run_id = str(uuid.uuid4())
     row: dict[str, Any] = {
+        "id": run_id,
         "source": source,
         "status": "running",
         "started_at": datetime.now(timezone.utc).isoformat(),
@@ -509,12 +620,18 @@ def start_scrape_run(
     if config:
         row["config"] = config
 
-    result = get_client().table("scrape_runs").insert(row).execute()
-    run_id: str = result.data[0]["id"]
+    _writer_pool.submit(_insert_scrape_run, row)
     logger.info("Started scrape run %s (source=%s)", run_id, source)
     return run_id
 
 
+def _insert_scrape_run(row: dict[str, Any]) -> None:
+    try:
+        _retry(lambda: get_client().table("scrape_runs").insert(row, returning="minimal").execute())
+    except Exception as e:
+        logger.error("Failed to record scrape run %s: %s", row["id"], e)
+
+
 def finish_scrape_run(
     run_id: str,
     total_found: int = 0,
@@ -522,24 +639,30 @@ def finish_scrape_run(
     errors: int = 0,
     status: str = "completed",
 ) -> None:
-    """Mark a scrape run as finished with stats."""
+    """Queue the finished-with-stats update for a scrape run."""
+    updates = {
+        "total_found": total_found,
+        "new_found": new_found,
+        "errors": errors,
+        "status": status,
+        "finished_at": datetime.now(timezone.utc).isoformat(),
+    }
+    _writer_pool.submit(_update_scrape_run, run_id, updates)
+
+
+def _update_scrape_run(run_id: str, updates: dict[str, Any]) -> None:
     try:
         (
             get_client()
             .table("scrape_runs")
-            .update({
-                "total_found": total_found,
-                "new_found": new_found,
-                "errors": errors,
-                "status": status,
-                "finished_at": datetime.now(timezone.utc).isoformat(),
-            })
+            .update(updates, returning="minimal")
             .eq("id", run_id)
             .execute()
         )
         logger.info(
             "Finished scrape run %s: total=%d new=%d errors=%d status=%s",
-            run_id, total_found, new_found, errors, status,
+            run_id, updates["total_found"], updates["new_found"],
+            updates["errors"], updates["status"],
         )
     except Exception as e:
         logger.error("Failed to finish scrape run %s: %s", run_id, e)
@@ -557,11 +680,11 @@ def delete_old_jobs(days: int = 90) -> int:
         result = (
             get_client()
             .table("jobs")
-            .delete()
+            .delete(count="exact", returning="minimal")
             .lt("first_seen", cutoff)
             .execute()
         )
-        count = len(result.data) if result.data else 0
+        count = result.count or 0
         logger.info("Deleted %d jobs older than %d days", count, days)
         return count
     except Exception as e:
@@ -577,12 +700,12 @@ def mark_inactive_jobs(hours: int = 48) -> int:
         result = (
             get_client()
             .table("jobs")
-            .update({"is_active": False})
+            .update({"is_active": False}, count="exact", returning="minimal")
             .eq("is_active", True)
             .lt("last_seen", cutoff)
             .execute()
         )
-        count = len(result.data) if result.data else 0
+        count = result.count or 0
         logger.info("Marked %d jobs inactive (last_seen > %dh ago)", count, hours)
         return count
     except Exception as e:
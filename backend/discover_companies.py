@@ -30,13 +30,23 @@ import argparse
 import asyncio
 import logging
 import os
+import random
 import re
 import sys
+from collections.abc import AsyncIterator, Iterable
 from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from itertools import islice
 from pathlib import Path
-from urllib.parse import urlparse
+from typing import Any
 
 import aiohttp
+import orjson
+
+try:
+    import aiodns  # backs aiohttp.AsyncResolver
+except ImportError:
+    aiodns = None
 
 try:
     from dotenv import load_dotenv
@@ -46,25 +56,67 @@ except ImportError:
 
 from config import (
     ATS_API_TEMPLATES,
-    ATS_DOMAIN_MAP,
     GITHUB_HIRING_REPOS,
     LOG_FORMAT,
     LOG_LEVEL,
+    PROBE_RECHECK_HOURS,
+    REQUEST_HEADERS,
     SCRAPE_CONCURRENCY,
+    SCRAPE_CONCURRENCY_PER_HOST,
     SCRAPE_TIMEOUT,
-    SLUG_PATTERNS,
+    detect_ats_domain,
+    url_hostname,
 )
 import db
+from seed_from_results import extract_slug_from_url, generate_api_url
 
 logging.basicConfig(format=LOG_FORMAT, level=LOG_LEVEL)
 logger = logging.getLogger(__name__)
 
+# Request timeouts, built once rather than per request
+GITHUB_TIMEOUT = aiohttp.ClientTimeout(total=15)
+YC_TIMEOUT = aiohttp.ClientTimeout(total=20)
+PROBE_TIMEOUT = aiohttp.ClientTimeout(total=SCRAPE_TIMEOUT)
+
+# Max in-flight probe tasks created at once by cross-probing
+PROBE_CHUNK_SIZE = 1024
+
+# Probe responses worth retrying (rate limits, transient server errors)
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+PROBE_RETRIES = 3
+PROBE_MAX_BACKOFF = 10.0
+
+
+def _make_connector() -> aiohttp.TCPConnector:
+    """
+    Connector for discovery traffic. Probes fan out across hundreds of
+    distinct hosts (<slug>.bamboohr.com, <slug>.recruitee.com, ...), so
+    when aiodns is installed lookups are resolved asynchronously instead
+    of queueing on the event loop's getaddrinfo thread pool.
+    """
+    resolver = None
+    if aiodns is not None:
+        resolver = aiohttp.AsyncResolver(timeout=2.0, tries=2)
+    return aiohttp.TCPConnector(
+        limit=SCRAPE_CONCURRENCY,
+        limit_per_host=SCRAPE_CONCURRENCY_PER_HOST,
+        ttl_dns_cache=300,
+        resolver=resolver,
+    )
+
+
+def _make_session() -> aiohttp.ClientSession:
+    """Session shared by every discovery phase, so DNS/TLS/keep-alive carry over."""
+    return aiohttp.ClientSession(
+        connector=_make_connector(), timeout=PROBE_TIMEOUT, headers=REQUEST_HEADERS,
+    )
+
 
 # ---------------------------------------------------------------------------
 # Data structures
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class DiscoveredCompany:
     slug: str
     ats: str
@@ -82,75 +134,67 @@ async def discover_from_github(session: aiohttp.ClientSession) -> list[Discovere
     Scrape GitHub README files from hiring repos.
     Extracts ATS URLs (greenhouse, lever, etc.) from markdown links.
     """
-    companies: list[DiscoveredCompany] = []
-
-    for repo in GITHUB_HIRING_REPOS:
-        url = f"https://raw.githubusercontent.com/{repo}/main/README.md"
-        try:
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as resp:
-                if resp.status == 404:
-                    # Try master branch
-                    url = f"https://raw.githubusercontent.com/{repo}/master/README.md"
-                    async with session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as resp2:
-                        if resp2.status != 200:
-                            logger.warning("GitHub repo %s: neither main nor master branch found", repo)
-                            continue
-                        text = await resp2.text()
-                elif resp.status != 200:
-                    logger.warning("GitHub repo %s returned %d", repo, resp.status)
-                    continue
-                else:
-                    text = await resp.text()
-
-            extracted = _extract_ats_urls_from_markdown(text, source=f"github:{repo}")
-            companies.extend(extracted)
-            logger.info("GitHub %s: extracted %d companies", repo, len(extracted))
-
-        except Exception as e:
-            logger.error("Failed to fetch GitHub repo %s: %s", repo, e)
-
-    return companies
+    # Fetch every README at once; each is parsed as soon as it arrives
+    per_repo = await asyncio.gather(*(
+        _discover_from_repo(session, repo) for repo in GITHUB_HIRING_REPOS
+    ))
+    return [c for extracted in per_repo for c in extracted]
+
+
+async def _discover_from_repo(session: aiohttp.ClientSession, repo: str) -> list[DiscoveredCompany]:
+    """Fetch one repo's README and extract its ATS companies."""
+    # HEAD resolves to the repo's default branch (main, master, ...)
+    url = f"https://raw.githubusercontent.com/{repo}/HEAD/README.md"
+    try:
+        async with session.get(url, timeout=GITHUB_TIMEOUT) as resp:
+            if resp.status != 200:
+                logger.warning("GitHub repo %s returned %d", repo, resp.status)
+                return []
+            text = await resp.text()
+
+        extracted = _extract_ats_urls_from_markdown(text, source=f"github:{repo}")
+        logger.info("GitHub %s: extracted %d companies", repo, len(extracted))
+        return extracted
+
+    except Exception as e:
+        logger.error("Failed to fetch GitHub repo %s: %s", repo, e)
+        return []
+
+
+# All URLs in markdown links: [text](url) and bare URLs
+_MARKDOWN_URL_RE = re.compile(
+    r'\[([^\]]*)\]\((https?://[^\s\)]+)\)'  # [name](url)
+    r'|'
+    r'(https?://[^\s\)\]]+)'  # bare URL
+)
+# Markdown formatting stripped from link text used as a company name
+_LINK_TEXT_NOISE_RE = re.compile(r"[|\*\[\]]")
 
 
 def _extract_ats_urls_from_markdown(text: str, source: str) -> list[DiscoveredCompany]:
     """Extract ATS URLs from markdown content."""
     companies: list[DiscoveredCompany] = []
 
-    # Find all URLs in markdown links: [text](url) and bare URLs
-    url_pattern = re.compile(
-        r'(?:'
-        r'\[([^\]]*)\]\((https?://[^\s\)]+)\)'  # [name](url)
-        r'|'
-        r'(https?://[^\s\)\]]+)'  # bare URL
-        r')'
-    )
-
-    for match in url_pattern.finditer(text):
+    for match in _MARKDOWN_URL_RE.finditer(text):
         link_text = match.group(1) or ""
         url = match.group(2) or match.group(3) or ""
         if not url:
             continue
 
         # Only process URLs that match known ATS domains
-        hostname = (urlparse(url).hostname or "").lower()
-        ats_name: str | None = None
-        for domain, ats in sorted(ATS_DOMAIN_MAP.items(), key=lambda x: -len(x[0])):
-            if domain in hostname:
-                ats_name = ats
-                break
+        ats_name = detect_ats_domain(url_hostname(url))
 
         if not ats_name or ats_name in ("linkedin", "wellfound"):
             continue
 
         # Extract slug from the URL using the same logic as seed script
-        from seed_from_results import extract_slug_from_url
         extracted = extract_slug_from_url(url)
         if extracted:
             extracted.source_file = source
             # Use the markdown link text as company name if available
             if link_text and not extracted.name:
                 # Clean markdown link text
-                name = re.sub(r"[|\*\[\]]", "", link_text).strip()
+                name = _LINK_TEXT_NOISE_RE.sub("", link_text).strip()
                 if name and len(name) < 100:
                     extracted.name = name
 
@@ -185,12 +229,11 @@ async def discover_from_yc(session: aiohttp.ClientSession) -> list[DiscoveredCom
         try:
             async with session.get(
                 try_url,
-                timeout=aiohttp.ClientTimeout(total=20),
-                headers={"Accept": "application/json"},
+                timeout=YC_TIMEOUT,
             ) as resp:
                 if resp.status != 200:
                     continue
-                data = await resp.json(content_type=None)
+                data = orjson.loads(await resp.read())
 
                 if isinstance(data, list):
                     company_list = data
@@ -212,7 +255,6 @@ async def discover_from_yc(session: aiohttp.ClientSession) -> list[DiscoveredCom
 
                     # If we have an ATS URL, extract the company from it
                     if ats_url:
-                        from seed_from_results import extract_slug_from_url, detect_ats_from_url
                         extracted = extract_slug_from_url(ats_url)
                         if extracted:
                             companies.append(DiscoveredCompany(
@@ -250,50 +292,79 @@ async def discover_from_yc(session: aiohttp.ClientSession) -> list[DiscoveredCom
 # Source 3: ATS API Probing
 # ---------------------------------------------------------------------------
 
+def _retry_delay(attempt: int, retry_after: str | None) -> float:
+    """Seconds to wait before retry `attempt`: Retry-After if given, else jittered backoff."""
+    if retry_after and retry_after.isdigit():
+        return min(float(retry_after), PROBE_MAX_BACKOFF)
+    return min(2 ** attempt, PROBE_MAX_BACKOFF) + random.random()
+
+
 async def probe_company(
     session: aiohttp.ClientSession,
     slug: str,
     ats: str,
     semaphore: asyncio.Semaphore,
-) -> tuple[str, str, bool, int]:
+    host_semaphores: dict[str, asyncio.Semaphore],
+) -> tuple[str, str, bool | None, int]:
     """
     Probe an ATS API to check if a company has an active job board.
-    Returns (slug, ats, is_active, job_count).
+    `host_semaphores` (shared by all probes of a run, filled on demand) caps
+    requests per API host so one slow ATS can't take every global slot.
+    Rate limits and 5xx responses are retried with backoff.
+    Returns (slug, ats, is_active, job_count); is_active is None when the
+    board couldn't be checked (still throttled/erroring, timeout, network
+    error), so callers leave the company as it is.
     """
     template = ATS_API_TEMPLATES.get(ats)
     if not template:
         return slug, ats, False, 0
 
     api_url = template.format(slug=slug)
-
-    async with semaphore:
-        try:
-            async with session.get(
-                api_url,
-                timeout=aiohttp.ClientTimeout(total=SCRAPE_TIMEOUT),
-                headers={"Accept": "application/json"},
-            ) as resp:
-                if resp.status == 200:
-                    try:
-                        data = await resp.json(content_type=None)
-                        job_count = _count_jobs_in_response(data, ats)
-                        return slug, ats, True, job_count
-                    except Exception:
-                        # Got 200 but invalid JSON — still counts as active
-                        return slug, ats, True, 0
-                elif resp.status == 404:
-                    return slug, ats, False, 0
-                else:
-                    # 429, 500, etc. — don't mark as inactive, might be transient
-                    logger.debug("Probe %s/%s returned %d", ats, slug, resp.status)
-                    return slug, ats, False, 0
-
-        except asyncio.TimeoutError:
-            logger.debug("Probe %s/%s timed out", ats, slug)
-            return slug, ats, False, 0
-        except Exception as e:
-            logger.debug("Probe %s/%s error: %s", ats, slug, e)
-            return slug, ats, False, 0
+    host = url_hostname(api_url)
+    host_semaphore = host_semaphores.get(host)
+    if host_semaphore is None:
+        host_semaphore = host_semaphores[host] = asyncio.Semaphore(SCRAPE_CONCURRENCY_PER_HOST)
+
+    for attempt in range(PROBE_RETRIES):
+        # Hold the semaphores only for the request, not the backoff sleep.
+        # Host first, so a probe queued behind a busy host holds no global slot.
+        async with host_semaphore, semaphore:
+            try:
+                async with session.get(
+                    api_url,
+                    timeout=PROBE_TIMEOUT,
+                ) as resp:
+                    if resp.status == 200:
+                        try:
+                            data = orjson.loads(await resp.read())
+                            job_count = _count_jobs_in_response(data, ats)
+                            return slug, ats, True, job_count
+                        except Exception:
+                            # Got 200 but invalid JSON — still counts as active
+                            return slug, ats, True, 0
+                    if resp.status not in RETRYABLE_STATUSES:
+                        # 404 (and other client errors) — no board here
+                        return slug, ats, False, 0
+                    logger.debug("Probe %s/%s returned %d (attempt %d/%d)",
+                                 ats, slug, resp.status, attempt + 1, PROBE_RETRIES)
+                    retry_after = resp.headers.get("Retry-After")
+
+            except asyncio.TimeoutError:
+                logger.debug("Probe %s/%s timed out", ats, slug)
+                return slug, ats, None, 0
+            except Exception as e:
+                logger.debug("Probe %s/%s error: %s", ats, slug, e)
+                return slug, ats, None, 0
+
+        if attempt < PROBE_RETRIES - 1:
+            await asyncio.sleep(_retry_delay(attempt, retry_after))
+
+    return slug, ats, None, 0
+
+
+# Where each ATS puts its job list: Greenhouse/Ashby "jobs", Workable
+# "results", SmartRecruiters "content", Recruitee "offers", Teamtailor "data"
+_JOB_LIST_KEYS: tuple[str, ...] = ("jobs", "results", "content", "offers", "data")
 
 
 def _count_jobs_in_response(data: dict | list, ats: str) -> int:
@@ -304,81 +375,103 @@ def _count_jobs_in_response(data: dict | list, ats: str) -> int:
     if not isinstance(data, dict):
         return 0
 
-    # Greenhouse: { "jobs": [...] }
-    if "jobs" in data and isinstance(data["jobs"], list):
-        return len(data["jobs"])
-
-    # Ashby: { "jobs": [...] }
-    if "results" in data and isinstance(data["results"], list):
-        return len(data["results"])
-
-    # Workable: { "results": [...] }
-    if "results" in data:
-        return len(data["results"])
-
-    # SmartRecruiters: { "content": [...] }
-    if "content" in data and isinstance(data["content"], list):
-        return len(data["content"])
+    for key in _JOB_LIST_KEYS:
+        jobs = data.get(key)
+        if isinstance(jobs, list):
+            return len(jobs)
+    return 0
 
-    # Recruitee: { "offers": [...] }
-    if "offers" in data and isinstance(data["offers"], list):
-        return len(data["offers"])
 
-    return 0
+async def _probe_in_chunks(
+    session: aiohttp.ClientSession,
+    pairs: Iterable[tuple[str, str]],
+    semaphore: asyncio.Semaphore,
+    chunk_size: int = PROBE_CHUNK_SIZE,
+) -> AsyncIterator[tuple[str, str, bool | None, int]]:
+    """
+    Probe (slug, ats) pairs, yielding results as they complete.
+    Only `chunk_size` probe tasks exist at a time, so huge fan-outs
+    don't materialize one future per pair up front.
+    """
+    host_semaphores: dict[str, asyncio.Semaphore] = {}
+    it = iter(pairs)
+    while batch := list(islice(it, chunk_size)):
+        tasks = [
+            probe_company(session, slug, ats, semaphore, host_semaphores)
+            for slug, ats in batch
+        ]
+        for next_result in asyncio.as_completed(tasks):
+            yield await next_result
 
 
-async def probe_unverified_companies() -> tuple[int, int]:
+async def probe_unverified_companies(
+    session: aiohttp.ClientSession | None = None,
+) -> tuple[int, int]:
     """
     Probe all unverified companies that have API URLs.
+    Uses `session` if given, otherwise opens one for the call.
     Returns (verified_count, total_probed).
     """
-    companies = db.get_all_companies()
+    if session is None:
+        async with _make_session() as own_session:
+            return await probe_unverified_companies(own_session)
+
+    stale_before = (datetime.now(timezone.utc) - timedelta(hours=PROBE_RECHECK_HOURS)).isoformat()
+    companies = db.get_all_companies(stale_before=stale_before)
     unverified = [
         c for c in companies
         if not c.get("verified") and c.get("api_url")
     ]
 
     if not unverified:
-        logger.info("No unverified companies with API URLs to probe")
+        logger.info("No unverified companies with API URLs due for probing")
         return 0, 0
 
     logger.info("Probing %d unverified companies...", len(unverified))
 
     semaphore = asyncio.Semaphore(SCRAPE_CONCURRENCY)
-    connector = aiohttp.TCPConnector(limit=SCRAPE_CONCURRENCY)
-    verified_count = 0
+    host_semaphores: dict[str, asyncio.Semaphore] = {}
 
-    async with aiohttp.ClientSession(connector=connector) as session:
-        tasks = [
-            probe_company(session, c["slug"], c["ats"], semaphore)
-            for c in unverified
-        ]
-        results = await asyncio.gather(*tasks)
-
-        for slug, ats, is_active, job_count in results:
-            if is_active:
-                # Find the company and mark as verified
-                matching = [
-                    c for c in unverified
-                    if c["slug"] == slug and c["ats"] == ats
-                ]
-                for c in matching:
-                    db.update_company(c["id"], {
-                        "verified": True,
-                        "job_count": job_count,
-                    })
-                    verified_count += 1
+    tasks = [
+        probe_company(session, c["slug"], c["ats"], semaphore, host_semaphores)
+        for c in unverified
+    ]
+    results = await asyncio.gather(*tasks)
+
+    # gather keeps task order, so each result lines up with its company.
+    # Definitive answers are stamped with last_probed_at; unknown ones
+    # (is_active None) stay due so the next run tries them again.
+    probed_at = datetime.now(timezone.utc).isoformat()
+    updates: list[dict[str, Any]] = []
+    verified_count = 0
+    for c, (_, _, is_active, job_count) in zip(unverified, results):
+        if is_active is None:
+            continue
+        row = {"id": c["id"], "slug": c["slug"], "ats": c["ats"], "last_probed_at": probed_at}
+        if is_active:
+            row["verified"] = True
+            row["job_count"] = job_count
+            verified_count += 1
+        updates.append(row)
+    db.update_companies(updates)
 
     logger.info("Verified %d / %d probed companies", verified_count, len(unverified))
     return verified_count, len(unverified)
 
 
-async def cross_probe_linkedin_companies() -> int:
+async def cross_probe_linkedin_companies(
+    session: aiohttp.ClientSession | None = None,
+) -> int:
     """
     Take companies discovered only via LinkedIn (no ATS slug)
     and probe each major ATS to see if they have a board.
+    Uses `session` if given, otherwise opens one for the call.
     Returns count of new ATS companies discovered.
     """
+    if session is None:
+        async with _make_session() as own_session:
+            return await cross_probe_linkedin_companies(own_session)
+
     linkedin_companies = db.get_all_companies(ats="linkedin")
     if not linkedin_companies:
         logger.info("No LinkedIn-only companies to cross-probe")
@@ -387,50 +480,43 @@ async def cross_probe_linkedin_companies() -> int:
     logger.info("Cross-probing %d LinkedIn companies against ATS APIs...", len(linkedin_companies))
 
     semaphore = asyncio.Semaphore(SCRAPE_CONCURRENCY)
-    connector = aiohttp.TCPConnector(limit=SCRAPE_CONCURRENCY)
     discovered = 0
 
     # Only probe the high-volume ATS platforms
     probe_ats = ["greenhouse", "lever", "ashby", "workable", "smartrecruiters"]
 
-    async with aiohttp.ClientSession(connector=connector) as session:
-        tasks: list[asyncio.Task] = []
-
-        for company in linkedin_companies:
-            slug = company["slug"]
-            name = company.get("name")
-
-            for ats in probe_ats:
-                tasks.append(
-                    asyncio.ensure_future(
-                        probe_company(session, slug, ats, semaphore)
-                    )
-                )
-
-        results = await asyncio.gather(*tasks)
-
-        for slug, ats, is_active, job_count in results:
-            if is_active and job_count > 0:
-                # Find the original LinkedIn company for the name
-                matching_linkedin = [
-                    c for c in linkedin_companies if c["slug"] == slug
-                ]
-                name = matching_linkedin[0].get("name") if matching_linkedin else None
-
-                api_url = ATS_API_TEMPLATES.get(ats, "").format(slug=slug)
-                result = db.upsert_company(
-                    slug=slug,
-                    ats=ats,
-                    name=name,
-                    api_url=api_url,
-                    source="cross_probe:linkedin",
-                )
-                if result:
-                    db.update_company(result["id"], {
-                        "verified": True,
-                        "job_count": job_count,
-                    })
-                    discovered += 1
+    # First LinkedIn entry per slug supplies the company name
+    names = {c["slug"]: c.get("name") for c in reversed(linkedin_companies)}
+    pairs = ((c["slug"], ats) for c in linkedin_companies for ats in probe_ats)
+
+    found: dict[tuple[str, str], int] = {}
+    async for slug, ats, is_active, job_count in _probe_in_chunks(session, pairs, semaphore):
+        if is_active and job_count > 0:
+            found[(ats, slug)] = job_count
+
+    if found:
+        probed_at = datetime.now(timezone.utc).isoformat()
+        upserted = db.upsert_companies([
+            {
+                "slug": slug,
+                "ats": ats,
+                "name": names.get(slug),
+                "api_url": generate_api_url(ats, slug),
+                "source": "cross_probe:linkedin",
+            }
+            for ats, slug in found
+        ])
+        discovered = db.update_companies([
+            {
+                "id": row["id"],
+                "slug": row["slug"],
+                "ats": row["ats"],
+                "verified": True,
+                "job_count": found.get((row["ats"], row["slug"]), 0),
+                "last_probed_at": probed_at,
+            }
+            for row in upserted
+        ])
 
     logger.info("Cross-probe discovered %d new ATS companies", discovered)
     return discovered
@@ -440,6 +526,27 @@ async def cross_probe_linkedin_companies() -> int:
 # Main discovery pipeline
 # ---------------------------------------------------------------------------
 
+def _save_discovered(companies: list[DiscoveredCompany]) -> tuple[int, int]:
+    """
+    Upsert discovered companies in bulk. Returns (saved, failed), counted
+    per distinct (ats, slug).
+    """
+    rows = [
+        {
+            "slug": c.slug,
+            "ats": c.ats,
+            "name": c.name,
+            "api_url": generate_api_url(c.ats, c.slug),
+            "careers_url": c.careers_url,
+            "source": c.source,
+        }
+        for c in companies
+    ]
+    saved = len(db.upsert_companies(rows))
+    distinct = len({(c.ats.lower().strip(), c.slug.lower().strip()) for c in companies})
+    return saved, distinct - saved
+
+
 async def run_discovery(
     github: bool = True,
     yc: bool = True,
@@ -463,8 +570,7 @@ async def run_discovery(
     total_discovered = 0
     errors = 0
 
-    connector = aiohttp.TCPConnector(limit=SCRAPE_CONCURRENCY)
-    async with aiohttp.ClientSession(connector=connector) as session:
+    async with _make_session() as session:
 
         # ---------------------------------------------------------------
         # Source 1: GitHub repos
@@ -475,20 +581,9 @@ async def run_discovery(
             logger.info("GitHub total: %d companies", len(github_companies))
 
             if not dry_run:
-                for c in github_companies:
-                    api_url = ATS_API_TEMPLATES.get(c.ats, "").format(slug=c.slug)
-                    result = db.upsert_company(
-                        slug=c.slug,
-                        ats=c.ats,
-                        name=c.name,
-                        api_url=api_url if api_url else None,
-                        careers_url=c.careers_url,
-                        source=c.source,
-                    )
-                    if result:
-                        total_discovered += 1
-                    else:
-                        errors += 1
+                added, failed = _save_discovered(github_companies)
+                total_discovered += added
+                errors += failed
 
         # ---------------------------------------------------------------
         # Source 2: YC
@@ -499,40 +594,25 @@ async def run_discovery(
             logger.info("YC total: %d companies", len(yc_companies))
 
             if not dry_run:
-                for c in yc_companies:
-                    api_url = None
-                    if c.ats != "unknown":
-                        template = ATS_API_TEMPLATES.get(c.ats, "")
-                        api_url = template.format(slug=c.slug) if template else None
-
-                    result = db.upsert_company(
-                        slug=c.slug,
-                        ats=c.ats,
-                        name=c.name,
-                        api_url=api_url,
-                        careers_url=c.careers_url,
-                        source=c.source,
-                    )
-                    if result:
-                        total_discovered += 1
-                    else:
-                        errors += 1
+                added, failed = _save_discovered(yc_companies)
+                total_discovered += added
+                errors += failed
 
-    # ---------------------------------------------------------------
-    # Probe unverified companies
-    # ---------------------------------------------------------------
-    if probe and not dry_run:
-        logger.info("=== Probing unverified companies ===")
-        verified, probed = await probe_unverified_companies()
-        logger.info("Probed %d, verified %d", probed, verified)
+        # ---------------------------------------------------------------
+        # Probe unverified companies
+        # ---------------------------------------------------------------
+        if probe and not dry_run:
+            logger.info("=== Probing unverified companies ===")
+            verified, probed = await probe_unverified_companies(session)
+            logger.info("Probed %d, verified %d", probed, verified)
 
-    # ---------------------------------------------------------------
-    # Cross-probe LinkedIn companies
-    # ---------------------------------------------------------------
-    if cross_probe and not dry_run:
-        logger.info("=== Cross-probing LinkedIn companies ===")
-        cross_found = await cross_probe_linkedin_companies()
-        total_discovered += cross_found
+        # ---------------------------------------------------------------
+        # Cross-probe LinkedIn companies
+        # ---------------------------------------------------------------
+        if cross_probe and not dry_run:
+            logger.info("=== Cross-probing LinkedIn companies ===")
+            cross_found = await cross_probe_linkedin_companies(session)
+            total_discovered += cross_found
 
     # ---------------------------------------------------------------
     # Summary
@@ -546,8 +626,12 @@ async def run_discovery(
             status="completed",
         )
 
-    total_companies = db.get_company_count() if not dry_run else 0
-    verified_total = len(db.get_verified_companies()) if not dry_run else 0
+    total_companies, verified_total = 0, 0
+    if not dry_run:
+        total_companies, verified = db.fetch_concurrently(
+            db.get_company_count, db.get_verified_companies,
+        )
+        verified_total = len(verified)
 
     logger.info("=== DISCOVERY COMPLETE ===")
     logger.info("New companies added: %d", total_discovered)
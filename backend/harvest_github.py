@@ -23,6 +23,7 @@ from typing import Any
 from urllib.parse import urlparse
 
 import aiohttp
+import orjson
 
 try:
     from dotenv import load_dotenv
@@ -35,11 +36,12 @@ from config import (
     ATS_DOMAIN_MAP,
     LOG_FORMAT,
     LOG_LEVEL,
+    REQUEST_HEADERS,
     SCRAPE_CONCURRENCY,
     SCRAPE_TIMEOUT,
 )
 import db
-from seed_from_results import extract_slug_from_url
+from seed_from_results import extract_slug_from_url, generate_api_url
 
 logging.basicConfig(format=LOG_FORMAT, level=LOG_LEVEL)
 logger = logging.getLogger(__name__)
@@ -58,18 +60,24 @@ REPOS = [
 
 
 async def fetch_readme(session: aiohttp.ClientSession, repo: str) -> str | None:
-    """Fetch README content from a GitHub repo."""
-    for branch in ["main", "master"]:
-        url = f"https://raw.githubusercontent.com/{repo}/{branch}/README.md"
-        try:
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as resp:
-                if resp.status == 200:
-                    return await resp.text()
-        except Exception as e:
-            logger.debug("Failed to fetch %s (%s): %s", repo, branch, e)
+    """Fetch README content from a GitHub repo's default branch."""
+    url = f"https://raw.githubusercontent.com/{repo}/HEAD/README.md"
+    try:
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as resp:
+            if resp.status == 200:
+                return await resp.text()
+            logger.debug("Failed to fetch %s: HTTP %d", repo, resp.status)
+    except Exception as e:
+        logger.debug("Failed to fetch %s: %s", repo, e)
     return None
 
 
+# Markdown links: [Company Name](url)
+_LINK_RE = re.compile(r'\[([^\]]+)\]\((https?://[^\s\)]+)\)')
+_NAME_MARKUP_RE = re.compile(r'[*_`~]')
+_NON_SLUG_RE = re.compile(r'[^a-z0-9]+')
+
+
 def extract_companies_from_readme(text: str, repo: str) -> list[dict[str, Any]]:
     """
     Extract all company career links from a README.
@@ -77,10 +85,7 @@ def extract_companies_from_readme(text: str, repo: str) -> list[dict[str, Any]]:
     """
     companies: list[dict[str, Any]] = []
 
-    # Match markdown links: [Company Name](url)
-    link_pattern = re.compile(r'\[([^\]]+)\]\((https?://[^\s\)]+)\)')
-
-    for match in link_pattern.finditer(text):
+    for match in _LINK_RE.finditer(text):
         name = match.group(1).strip()
         url = match.group(2).strip()
 
@@ -89,7 +94,7 @@ def extract_companies_from_readme(text: str, repo: str) -> list[dict[str, Any]]:
             continue
 
         # Clean name (remove markdown formatting)
-        name = re.sub(r'[*_`~]', '', name).strip()
+        name = _NAME_MARKUP_RE.sub('', name).strip()
         if not name or len(name) < 2 or len(name) > 100:
             continue
 
@@ -105,7 +110,7 @@ def extract_companies_from_readme(text: str, repo: str) -> list[dict[str, Any]]:
             })
         else:
             # Unknown URL - save company name for cross-probing
-            slug = re.sub(r'[^a-z0-9]+', '-', name.lower()).strip('-')
+            slug = _NON_SLUG_RE.sub('-', name.lower()).strip('-')
             if slug and len(slug) >= 2:
                 companies.append({
                     "name": name,
@@ -174,11 +179,10 @@ async def probe_company_against_all_ats(
                 async with session.get(
                     api_url,
                     timeout=aiohttp.ClientTimeout(total=SCRAPE_TIMEOUT),
-                    headers={"Accept": "application/json"},
                 ) as resp:
                     if resp.status == 200:
                         try:
-                            data = await resp.json(content_type=None)
+                            data = orjson.loads(await resp.read())
                             job_count = _count_jobs(data)
                             if job_count > 0:
                                 found.append({
@@ -213,11 +217,12 @@ async def run_harvest(dry_run: bool = False, probe: bool = False) -> None:
 
     all_companies: list[dict[str, Any]] = []
 
-    async with aiohttp.ClientSession(connector=connector) as session:
-        # Fetch all READMEs
-        for repo in REPOS:
-            logger.info("Fetching %s...", repo)
-            text = await fetch_readme(session, repo)
+    async with aiohttp.ClientSession(connector=connector, headers=REQUEST_HEADERS) as session:
+        # Fetch all READMEs concurrently, then extract in repo order
+        logger.info("Fetching %d READMEs...", len(REPOS))
+        texts = await asyncio.gather(*(fetch_readme(session, repo) for repo in REPOS))
+        for repo, text in zip(REPOS, texts):
+            logger.info("%s:", repo)
             if not text:
                 logger.warning("  Could not fetch README for %s", repo)
                 continue
@@ -257,7 +262,7 @@ async def run_harvest(dry_run: bool = False, probe: bool = False) -> None:
     added = 0
 
     for c in ats_companies:
-        api_url = ATS_API_TEMPLATES.get(c["ats"], "").format(slug=c["slug"])
+        api_url = generate_api_url(c["ats"], c["slug"])
         result = db.upsert_company(
             slug=c["slug"],
             ats=c["ats"],
@@ -278,7 +283,7 @@ async def run_harvest(dry_run: bool = False, probe: bool = False) -> None:
         semaphore = asyncio.Semaphore(SCRAPE_CONCURRENCY)
         connector = aiohttp.TCPConnector(limit=SCRAPE_CONCURRENCY)
 
-        async with aiohttp.ClientSession(connector=connector) as session:
+        async with aiohttp.ClientSession(connector=connector, headers=REQUEST_HEADERS) as session:
             for i, c in enumerate(unknown_companies):
                 if i % 50 == 0 and i > 0:
                     logger.info("  Probed %d / %d...", i, len(unknown_companies))
@@ -321,8 +326,11 @@ async def run_harvest(dry_run: bool = False, probe: bool = False) -> None:
     logger.info("Companies from READMEs: %d", added)
     logger.info("Found via cross-probe: %d", probed_found)
     logger.info("Newly verified: %d", verified)
-    logger.info("Total companies: %d", db.get_company_count())
-    logger.info("Total verified: %d", len(db.get_verified_companies()))
+    total_companies, verified_companies = db.fetch_concurrently(
+        db.get_company_count, db.get_verified_companies,
+    )
+    logger.info("Total companies: %d", total_companies)
+    logger.info("Total verified: %d", len(verified_companies))
 
 
 def main() -> None:
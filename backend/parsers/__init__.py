@@ -6,11 +6,13 @@ Each parser normalizes an ATS API response into a common job schema.
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedJob:
     """Normalized job from any ATS source."""
     url: str
@@ -28,14 +30,145 @@ class ParsedJob:
     raw_data: dict[str, Any] = field(default_factory=dict)
 
 
+def extract_raw_jobs(data: Any, *keys: str) -> list[Any]:
+    """
+    The job list of an ATS response: `data` itself if it is a list, else
+    the value of the first of `keys` present in it (only if it is a list).
+    """
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict):
+        for key in keys:
+            if key in data:
+                value = data[key]
+                return value if isinstance(value, list) else []
+    return []
+
+
+def build_location(
+    loc: Any,
+    keys: tuple[str, ...] = ("city", "region"),
+    fallback: str | None = "country",
+) -> str | None:
+    """
+    Join the non-empty `keys` of a location dict with ", ". When none are
+    set, use the `fallback` key alone.
+    """
+    if not loc or not isinstance(loc, dict):
+        return None
+    parts = [loc[key] for key in keys if loc.get(key)]
+    if not parts and fallback and loc.get(fallback):
+        return loc[fallback]
+    return ", ".join(parts) if parts else None
+
+
+def to_int(value: Any) -> int | None:
+    """
+    Coerce a JSON number or numeric string to int, or None if it isn't one.
+    Integers and integer strings skip the float round trip.
+    """
+    if value is None or value == "":
+        return None
+    if type(value) is int:  # not bool
+        return value
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        pass
+    try:
+        return int(float(value))
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+
+_SALARY_AMOUNT_RE = re.compile(r"[\d,]+\.?\d*[kK]?")
+
+
+def parse_salary_amounts(s: str) -> tuple[int | None, int | None]:
+    """
+    (min, max) of the amounts in a salary string like '$120,000 - $180,000'
+    or '$120K-$180K'. max is None when only one amount is found.
+    """
+    low: int | None = None
+    high: int | None = None
+    found = 0
+    for match in _SALARY_AMOUNT_RE.finditer(s):
+        amt = match.group().replace(",", "")
+        try:
+            if amt[-1:] in ("k", "K"):
+                value = int(float(amt[:-1]) * 1000)
+            else:
+                val = float(amt)
+                if val <= 0:
+                    continue
+                value = int(val)
+        except ValueError:  # a bare "," or ",." run
+            continue
+        found += 1
+        if low is None or value < low:
+            low = value
+        if high is None or value > high:
+            high = value
+
+    if found >= 2:
+        return low, high
+    return low, None
+
+
+# Raw-job keys whose values can describe the workplace. Everything else
+# (descriptions, ids, URLs, boolean flags the parsers check themselves) is
+# ignored, so a long descriptionHtml is never stringified and key names
+# like "isRemote": false don't count as a match.
+_WORKPLACE_KEYS: tuple[str, ...] = (
+    "workplaceType", "workplace", "workplace_type", "remote-status", "remotePolicy",
+    "employmentType", "location", "locations", "location_name", "locationLabel",
+    "locationRestrictions", "secondaryLocations", "office", "offices",
+)
+
+
+def _string_values(value: Any) -> list[str]:
+    """String leaves of a JSON value (dict keys and non-strings excluded)."""
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, dict):
+        value = value.values()
+    elif not isinstance(value, list):
+        return []
+    return [s for v in value for s in _string_values(v)]
+
+
+def _workplace_text(metadata: dict[str, Any] | None) -> str:
+    """Lowercased text of the whitelisted workplace fields in `metadata`."""
+    if not metadata:
+        return ""
+    return " ".join(
+        s for key in _WORKPLACE_KEYS if key in metadata
+        for s in _string_values(metadata[key])
+    ).lower()
+
+
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def clean_html(html: str) -> str:
+    """Strip HTML tags for plain text description."""
+    if not html:
+        return ""
+    # Plain-text descriptions skip the tag regex entirely
+    if "<" in html:
+        html = _TAG_RE.sub(" ", html)
+    # split()/join collapses and trims whitespace in one C-level pass
+    return " ".join(html.split())
+
+
 def detect_remote_type(
     title: str,
     location: str | None = None,
     metadata: dict[str, Any] | None = None,
 ) -> str:
-    """Infer remote type from job title, location, and metadata."""
+    """Infer remote type from job title, location, and workplace metadata."""
     text = f"{title} {location or ''}".lower()
-    meta_str = str(metadata or {}).lower()
+    meta_str = _workplace_text(metadata)
 
     if "hybrid" in text or "hybrid" in meta_str:
         return "hybrid"
@@ -48,17 +181,26 @@ def detect_remote_type(
     return "unknown"
 
 
+# Seniority keywords, one compiled alternation per level. Levels are checked
+# in this order and the first one with a keyword anywhere in the title wins.
+_SENIORITY_PATTERNS: tuple[tuple[str, re.Pattern[str]], ...] = tuple(
+    (level, re.compile("|".join(map(re.escape, keywords))))
+    for level, keywords in (
+        ("intern", ("intern ", "internship")),
+        ("junior", ("junior", "jr.", "jr ", "entry level", "entry-level", "new grad")),
+        ("senior", ("senior", "sr.", "sr ", "lead", "principal", "staff")),
+        ("director", ("director", "vp ", "vice president", "head of", "chief")),
+        ("manager", ("manager", "engineering manager")),
+    )
+)
+
+
+# Titles repeat heavily within and across boards ("Software Engineer" x 20)
+@lru_cache(maxsize=4096)
 def detect_seniority(title: str) -> str | None:
     """Infer seniority level from job title."""
     t = title.lower()
-    if any(k in t for k in ("intern ", "internship")):
-        return "intern"
-    if any(k in t for k in ("junior", "jr.", "jr ", "entry level", "entry-level", "new grad")):
-        return "junior"
-    if any(k in t for k in ("senior", "sr.", "sr ", "lead", "principal", "staff")):
-        return "senior"
-    if any(k in t for k in ("director", "vp ", "vice president", "head of", "chief")):
-        return "director"
-    if any(k in t for k in ("manager", "engineering manager")):
-        return "manager"
-    return "mid"
\ No newline at end of file
+    for level, pattern in _SENIORITY_PATTERNS:
+        if pattern.search(t):
+            return level
+    return "mid"
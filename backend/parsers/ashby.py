@@ -33,17 +33,19 @@ from __future__ import annotations
 import re
 from typing import Any
 
-from parsers import ParsedJob, detect_remote_type, detect_seniority
+from parsers import ParsedJob, detect_remote_type, detect_seniority, extract_raw_jobs
+
+# An amount with optional thousands separators/decimals and a "k" suffix.
+# Requires a leading digit so a stray "," isn't taken for a number.
+_AMOUNT_RE = re.compile(r"(\d[\d,]*(?:\.\d+)?)([kK]?)")
+
+# Checked in order; anything else is treated as USD
+_CURRENCY_SYMBOLS: tuple[tuple[str, str], ...] = (("€", "EUR"), ("£", "GBP"))
 
 
 def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
     """Parse Ashby API response into normalized jobs."""
-    if isinstance(data, dict):
-        raw_jobs = data.get("jobs", [])
-    elif isinstance(data, list):
-        raw_jobs = data
-    else:
-        return []
+    raw_jobs = extract_raw_jobs(data, "jobs")
 
     jobs: list[ParsedJob] = []
 
@@ -108,21 +110,18 @@ def _parse_compensation(comp_str: str) -> tuple[int | None, int | None, str]:
         return None, None, "USD"
 
     currency = "USD"
-    if "€" in comp_str:
-        currency = "EUR"
-    elif "£" in comp_str:
-        currency = "GBP"
+    for symbol, code in _CURRENCY_SYMBOLS:
+        if symbol in comp_str:
+            currency = code
+            break
 
-    amounts = re.findall(r"[\d,]+\.?\d*[kK]?", comp_str)
     parsed: list[int] = []
-    for amt in amounts:
-        amt = amt.replace(",", "")
-        if amt.lower().endswith("k"):
-            parsed.append(int(float(amt[:-1]) * 1000))
-        else:
-            val = float(amt)
-            if val > 0:
-                parsed.append(int(val))
+    for number, k_suffix in _AMOUNT_RE.findall(comp_str):
+        val = float(number.replace(",", ""))
+        if k_suffix:
+            parsed.append(int(val * 1000))
+        elif val > 0:
+            parsed.append(int(val))
 
     if len(parsed) >= 2:
         return min(parsed), max(parsed), currency
@@ -33,21 +33,14 @@ from __future__ import annotations
 import re
 from typing import Any
 
-from parsers import ParsedJob, detect_remote_type, detect_seniority
+from parsers import ParsedJob, detect_remote_type, detect_seniority, extract_raw_jobs
 
 
 def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
     """Parse BambooHR API response into normalized jobs."""
-    raw_jobs: list[dict] = []
-
     if isinstance(data, dict):
-        result = data.get("result", data)
-        if isinstance(result, list):
-            raw_jobs = result
-        elif isinstance(result, dict):
-            raw_jobs = result.get("jobOpenings", result.get("jobs", []))
-    elif isinstance(data, list):
-        raw_jobs = data
+        data = data.get("result", data)
+    raw_jobs = extract_raw_jobs(data, "jobOpenings", "jobs")
 
     jobs: list[ParsedJob] = []
 
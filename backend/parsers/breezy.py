@@ -30,20 +30,14 @@ Response: array of position objects
 
 from __future__ import annotations
 
-import re
 from typing import Any
 
-from parsers import ParsedJob, detect_remote_type, detect_seniority
+from parsers import ParsedJob, clean_html, detect_remote_type, detect_seniority, extract_raw_jobs
 
 
 def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
     """Parse Breezy HR API response into normalized jobs."""
-    if isinstance(data, dict):
-        raw_jobs = data.get("positions", data.get("jobs", data.get("results", [])))
-    elif isinstance(data, list):
-        raw_jobs = data
-    else:
-        return []
+    raw_jobs = extract_raw_jobs(data, "positions", "jobs", "results")
 
     jobs: list[ParsedJob] = []
 
@@ -68,7 +62,7 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
         location = _build_location(raw.get("location"))
 
         # Description
-        description = _clean_html(raw.get("description", ""))
+        description = clean_html(raw.get("description", ""))
 
         # Remote
         loc_data = raw.get("location") or {}
@@ -133,6 +127,24 @@ def _build_location(loc: Any) -> str | None:
     return ", ".join(parts) if parts else None
 
 
+_EXPERIENCE_MAP: dict[str, str] = {
+    "intern": "intern",
+    "entrylevel": "junior",
+    "entry_level": "junior",
+    "junior": "junior",
+    "midlevel": "mid",
+    "mid_level": "mid",
+    "mid": "mid",
+    "seniorlevel": "senior",
+    "senior_level": "senior",
+    "senior": "senior",
+    "lead": "senior",
+    "director": "director",
+    "executive": "director",
+    "manager": "manager",
+}
+
+
 def _map_experience(exp: Any) -> str | None:
     if not exp:
         return None
@@ -143,28 +155,4 @@ def _map_experience(exp: Any) -> str | None:
     else:
         return None
 
-    mapping = {
-        "intern": "intern",
-        "entrylevel": "junior",
-        "entry_level": "junior",
-        "junior": "junior",
-        "midlevel": "mid",
-        "mid_level": "mid",
-        "mid": "mid",
-        "seniorlevel": "senior",
-        "senior_level": "senior",
-        "senior": "senior",
-        "lead": "senior",
-        "director": "director",
-        "executive": "director",
-        "manager": "manager",
-    }
-    return mapping.get(exp_id)
-
-
-def _clean_html(html: str) -> str:
-    if not html:
-        return ""
-    text = re.sub(r"<[^>]+>", " ", html)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
\ No newline at end of file
+    return _EXPERIENCE_MAP.get(exp_id)
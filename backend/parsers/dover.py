@@ -24,20 +24,21 @@ Note: Dover's API format may vary. This parser handles known variants.
 
 from __future__ import annotations
 
-import re
 from typing import Any
 
-from parsers import ParsedJob, detect_remote_type, detect_seniority
+from parsers import (
+    ParsedJob,
+    clean_html,
+    detect_remote_type,
+    detect_seniority,
+    extract_raw_jobs,
+    parse_salary_amounts,
+)
 
 
 def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
     """Parse Dover API response into normalized jobs."""
-    if isinstance(data, dict):
-        raw_jobs = data.get("jobs", data.get("results", []))
-    elif isinstance(data, list):
-        raw_jobs = data
-    else:
-        return []
+    raw_jobs = extract_raw_jobs(data, "jobs", "results")
 
     jobs: list[ParsedJob] = []
 
@@ -57,7 +58,7 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
             continue
 
         location = raw.get("location")
-        description = _clean_html(raw.get("description", ""))
+        description = clean_html(raw.get("description", ""))
 
         # Salary
         salary_min, salary_max, salary_currency = _extract_salary(raw)
@@ -117,27 +118,5 @@ def _parse_salary_string(s: str) -> tuple[int | None, int | None, str]:
     elif "£" in s:
         currency = "GBP"
 
-    amounts = re.findall(r"[\d,]+\.?\d*[kK]?", s)
-    parsed: list[int] = []
-    for amt in amounts:
-        amt = amt.replace(",", "")
-        if amt.lower().endswith("k"):
-            parsed.append(int(float(amt[:-1]) * 1000))
-        else:
-            val = float(amt)
-            if val > 0:
-                parsed.append(int(val))
-
-    if len(parsed) >= 2:
-        return min(parsed), max(parsed), currency
-    elif len(parsed) == 1:
-        return parsed[0], None, currency
-    return None, None, currency
-
-
-def _clean_html(html: str) -> str:
-    if not html:
-        return ""
-    text = re.sub(r"<[^>]+>", " ", html)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
\ No newline at end of file
+    salary_min, salary_max = parse_salary_amounts(s)
+    return salary_min, salary_max, currency
@@ -25,22 +25,27 @@ Response:
 
 from __future__ import annotations
 
-import re
+from datetime import date, datetime, timezone
 from typing import Any
 
-from parsers import ParsedJob, detect_remote_type, detect_seniority
+from parsers import (
+    ParsedJob,
+    build_location,
+    clean_html,
+    detect_remote_type,
+    detect_seniority,
+    extract_raw_jobs,
+    to_int,
+)
 
 
 def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
     """Parse Freshteam API response into normalized jobs."""
-    if isinstance(data, dict):
-        raw_jobs = data.get("job_postings", data.get("jobs", data.get("data", [])))
-    elif isinstance(data, list):
-        raw_jobs = data
-    else:
-        return []
+    raw_jobs = extract_raw_jobs(data, "job_postings", "jobs", "data")
 
     jobs: list[ParsedJob] = []
+    base_url = f"https://{slug}.freshteam.com/jobs/"
+    today = datetime.now(timezone.utc).date()
 
     for raw in raw_jobs:
         if not isinstance(raw, dict):
@@ -50,18 +55,23 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
         if raw.get("status") and raw["status"] != "published":
             continue
 
+        # Skip postings whose closing date has passed
+        closing_date = _parse_closing_date(raw.get("closing_date"))
+        if closing_date is not None and closing_date < today:
+            continue
+
         title = raw.get("title", "").strip()
         job_id = raw.get("id", "")
         if not title:
             continue
 
-        url = f"https://{slug}.freshteam.com/jobs/{job_id}"
+        url = f"{base_url}{job_id}"
 
         # Location
         location = _build_location(raw.get("branch"))
 
         # Description
-        description = _clean_html(raw.get("description", ""))
+        description = clean_html(raw.get("description", ""))
 
         # Salary
         salary_min, salary_max, salary_currency = _extract_salary(raw.get("salary"))
@@ -101,23 +111,20 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
     return jobs
 
 
-def _build_location(branch: Any) -> str | None:
-    if not branch or not isinstance(branch, dict):
+def _parse_closing_date(value: Any) -> date | None:
+    """Date part of a closing_date (a date or an ISO timestamp); None if unparseable."""
+    if not isinstance(value, str):
+        return None
+    try:
+        return date.fromisoformat(value[:10])
+    except ValueError:
         return None
 
-    name = branch.get("name")
-    if name:
-        return name
-
-    parts: list[str] = []
-    if branch.get("city"):
-        parts.append(branch["city"])
-    if branch.get("state"):
-        parts.append(branch["state"])
-    if branch.get("country") and not parts:
-        parts.append(branch["country"])
 
-    return ", ".join(parts) if parts else None
+def _build_location(branch: Any) -> str | None:
+    if not branch or not isinstance(branch, dict):
+        return None
+    return branch.get("name") or build_location(branch, ("city", "state"))
 
 
 def _extract_salary(salary: Any) -> tuple[int | None, int | None, str]:
@@ -129,15 +136,7 @@ def _extract_salary(salary: Any) -> tuple[int | None, int | None, str]:
     currency = salary.get("currency", "USD") or "USD"
 
     return (
-        int(float(sal_min)) if sal_min else None,
-        int(float(sal_max)) if sal_max else None,
+        to_int(sal_min) if sal_min else None,
+        to_int(sal_max) if sal_max else None,
         currency,
     )
-
-
-def _clean_html(html: str) -> str:
-    if not html:
-        return ""
-    text = re.sub(r"<[^>]+>", " ", html)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
\ No newline at end of file
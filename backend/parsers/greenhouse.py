@@ -24,20 +24,21 @@ Response:
 
 from __future__ import annotations
 
-import re
 from typing import Any
 
-from parsers import ParsedJob, detect_remote_type, detect_seniority
+from parsers import (
+    ParsedJob,
+    clean_html,
+    detect_remote_type,
+    detect_seniority,
+    extract_raw_jobs,
+    parse_salary_amounts,
+)
 
 
 def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
     """Parse Greenhouse API response into normalized jobs."""
-    if isinstance(data, list):
-        raw_jobs = data
-    elif isinstance(data, dict):
-        raw_jobs = data.get("jobs", [])
-    else:
-        return []
+    raw_jobs = extract_raw_jobs(data, "jobs")
 
     jobs: list[ParsedJob] = []
 
@@ -54,7 +55,7 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
         location = location_obj.get("name") if isinstance(location_obj, dict) else None
 
         # Description (available if ?content=true was used)
-        description = _clean_html(raw.get("content", ""))
+        description = clean_html(raw.get("content", ""))
 
         # Salary from metadata
         salary_min, salary_max, salary_currency = _extract_salary(raw.get("metadata", []))
@@ -112,28 +113,5 @@ def _parse_salary_string(s: str) -> tuple[int | None, int | None, str]:
     elif "£" in s or "gbp" in s.lower():
         currency = "GBP"
 
-    amounts = re.findall(r"[\d,]+\.?\d*[kK]?", s)
-    parsed: list[int] = []
-    for amt in amounts:
-        amt = amt.replace(",", "")
-        if amt.lower().endswith("k"):
-            parsed.append(int(float(amt[:-1]) * 1000))
-        else:
-            val = float(amt)
-            if val > 0:
-                parsed.append(int(val))
-
-    if len(parsed) >= 2:
-        return min(parsed), max(parsed), currency
-    elif len(parsed) == 1:
-        return parsed[0], None, currency
-    return None, None, currency
-
-
-def _clean_html(html: str) -> str:
-    """Strip HTML tags for plain text description."""
-    if not html:
-        return ""
-    text = re.sub(r"<[^>]+>", " ", html)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
\ No newline at end of file
+    salary_min, salary_max = parse_salary_amounts(s)
+    return salary_min, salary_max, currency
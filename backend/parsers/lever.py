@@ -30,20 +30,15 @@ Response: array of posting objects
 
 from __future__ import annotations
 
+from datetime import datetime, timezone
 from typing import Any
 
-from parsers import ParsedJob, detect_remote_type, detect_seniority
+from parsers import ParsedJob, detect_remote_type, detect_seniority, extract_raw_jobs, to_int
 
 
 def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
     """Parse Lever API response into normalized jobs."""
-    if isinstance(data, dict):
-        # Some Lever responses wrap in an object
-        raw_jobs = data.get("postings", data.get("results", []))
-    elif isinstance(data, list):
-        raw_jobs = data
-    else:
-        return []
+    raw_jobs = extract_raw_jobs(data, "postings", "results")
 
     jobs: list[ParsedJob] = []
 
@@ -90,7 +85,6 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
         posted_at = None
         created_at = raw.get("createdAt")
         if isinstance(created_at, (int, float)) and created_at > 0:
-            from datetime import datetime, timezone
             posted_at = datetime.fromtimestamp(created_at / 1000, tz=timezone.utc).isoformat()
 
         jobs.append(ParsedJob(
@@ -122,12 +116,4 @@ def _extract_salary(raw: dict[str, Any]) -> tuple[int | None, int | None, str]:
     sal_max = salary_range.get("max")
     currency = salary_range.get("currency", "USD") or "USD"
 
-    def safe_int(v: Any) -> int | None:
-        if v is None or v == "":
-            return None
-        try:
-            return int(float(v))
-        except (ValueError, TypeError):
-            return None
-
-    return safe_int(sal_min), safe_int(sal_max), currency
\ No newline at end of file
+    return to_int(sal_min), to_int(sal_max), currency
\ No newline at end of file
@@ -26,20 +26,14 @@ Response:
 
 from __future__ import annotations
 
-import re
 from typing import Any
 
-from parsers import ParsedJob, detect_remote_type, detect_seniority
+from parsers import ParsedJob, clean_html, detect_remote_type, detect_seniority, extract_raw_jobs
 
 
 def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
     """Parse Personio API response into normalized jobs."""
-    if isinstance(data, dict):
-        raw_jobs = data.get("positions", data.get("jobs", data.get("data", [])))
-    elif isinstance(data, list):
-        raw_jobs = data
-    else:
-        return []
+    raw_jobs = extract_raw_jobs(data, "positions", "jobs", "data")
 
     jobs: list[ParsedJob] = []
 
@@ -62,7 +56,7 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
             continue
 
         location = raw.get("office") or raw.get("location")
-        description = _clean_html(raw.get("description", ""))
+        description = clean_html(raw.get("description", ""))
 
         # Remote
         remote_type = detect_remote_type(title, location, raw)
@@ -96,23 +90,17 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
     return jobs
 
 
+_SENIORITY_MAP: dict[str, str] = {
+    "student": "intern",
+    "entry-level": "junior",
+    "junior": "junior",
+    "experienced": "mid",
+    "senior": "senior",
+    "lead": "senior",
+    "executive": "director",
+    "manager": "manager",
+}
+
+
 def _map_seniority(s: str) -> str | None:
-    mapping = {
-        "student": "intern",
-        "entry-level": "junior",
-        "junior": "junior",
-        "experienced": "mid",
-        "senior": "senior",
-        "lead": "senior",
-        "executive": "director",
-        "manager": "manager",
-    }
-    return mapping.get(s)
-
-
-def _clean_html(html: str) -> str:
-    if not html:
-        return ""
-    text = re.sub(r"<[^>]+>", " ", html)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
\ No newline at end of file
+    return _SENIORITY_MAP.get(s)
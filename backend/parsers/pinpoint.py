@@ -27,20 +27,14 @@ Response:
 
 from __future__ import annotations
 
-import re
 from typing import Any
 
-from parsers import ParsedJob, detect_remote_type, detect_seniority
+from parsers import ParsedJob, clean_html, detect_remote_type, detect_seniority, extract_raw_jobs
 
 
 def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
     """Parse Pinpoint API response into normalized jobs."""
-    if isinstance(data, dict):
-        raw_jobs = data.get("data", data.get("postings", []))
-    elif isinstance(data, list):
-        raw_jobs = data
-    else:
-        return []
+    raw_jobs = extract_raw_jobs(data, "data", "postings")
 
     jobs: list[ParsedJob] = []
 
@@ -66,7 +60,7 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
         location = attrs.get("location_name") or attrs.get("location")
 
         # Description
-        description = _clean_html(attrs.get("description", ""))
+        description = clean_html(attrs.get("description", ""))
 
         # Remote
         if attrs.get("remote") is True:
@@ -94,11 +88,3 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
         ))
 
     return jobs
-
-
-def _clean_html(html: str) -> str:
-    if not html:
-        return ""
-    text = re.sub(r"<[^>]+>", " ", html)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
\ No newline at end of file
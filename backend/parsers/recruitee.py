@@ -42,22 +42,24 @@ Response:
 
 from __future__ import annotations
 
-import re
 from typing import Any
 
-from parsers import ParsedJob, detect_remote_type, detect_seniority
+from parsers import (
+    ParsedJob,
+    build_location,
+    clean_html,
+    detect_remote_type,
+    detect_seniority,
+    extract_raw_jobs,
+)
 
 
 def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
     """Parse Recruitee API response into normalized jobs."""
-    if isinstance(data, dict):
-        raw_jobs = data.get("offers", [])
-    elif isinstance(data, list):
-        raw_jobs = data
-    else:
-        return []
+    raw_jobs = extract_raw_jobs(data, "offers")
 
     jobs: list[ParsedJob] = []
+    base_url = f"https://{slug}.recruitee.com/o/"
 
     for raw in raw_jobs:
         if not isinstance(raw, dict):
@@ -73,13 +75,13 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
             continue
 
         if not url.startswith("http"):
-            url = f"https://{slug}.recruitee.com/o/{raw.get('slug', '')}"
+            url = f"{base_url}{raw.get('slug', '')}"
 
         # Location
-        location = raw.get("location") or _build_location(raw)
+        location = raw.get("location") or build_location(raw, ("city", "country"), None)
 
         # Description
-        description = _clean_html(raw.get("description", ""))
+        description = clean_html(raw.get("description", ""))
 
         # Salary
         salary_min = _safe_int(raw.get("salary_min"))
@@ -120,15 +122,6 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
     return jobs
 
 
-def _build_location(raw: dict[str, Any]) -> str | None:
-    parts: list[str] = []
-    if raw.get("city"):
-        parts.append(raw["city"])
-    if raw.get("country"):
-        parts.append(raw["country"])
-    return ", ".join(parts) if parts else None
-
-
 def _safe_int(val: Any) -> int | None:
     if val is None:
         return None
@@ -139,29 +132,23 @@ def _safe_int(val: Any) -> int | None:
         return None
 
 
+_EXPERIENCE_MAP: dict[str, str] = {
+    "intern": "intern",
+    "internship": "intern",
+    "junior": "junior",
+    "entry": "junior",
+    "mid": "mid",
+    "mid_senior": "senior",
+    "senior": "senior",
+    "lead": "senior",
+    "executive": "director",
+    "director": "director",
+    "manager": "manager",
+}
+
+
 def _map_experience(code: str | None) -> str | None:
     if not code:
         return None
     code = code.lower()
-    mapping = {
-        "intern": "intern",
-        "internship": "intern",
-        "junior": "junior",
-        "entry": "junior",
-        "mid": "mid",
-        "mid_senior": "senior",
-        "senior": "senior",
-        "lead": "senior",
-        "executive": "director",
-        "director": "director",
-        "manager": "manager",
-    }
-    return mapping.get(code)
-
-
-def _clean_html(html: str) -> str:
-    if not html:
-        return ""
-    text = re.sub(r"<[^>]+>", " ", html)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
\ No newline at end of file
+    return _EXPERIENCE_MAP.get(code)
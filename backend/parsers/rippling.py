@@ -28,22 +28,33 @@ Response:
 
 from __future__ import annotations
 
-import re
 from typing import Any
 
-from parsers import ParsedJob, detect_remote_type, detect_seniority
+from parsers import (
+    ParsedJob,
+    clean_html,
+    detect_remote_type,
+    detect_seniority,
+    extract_raw_jobs,
+    to_int,
+)
+
+
+_WORKPLACE_MAP: dict[str, str] = {
+    "REMOTE": "remote",
+    "HYBRID": "hybrid",
+    "ONSITE": "onsite",
+    "ON_SITE": "onsite",
+    "IN_OFFICE": "onsite",
+}
 
 
 def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
     """Parse Rippling ATS API response into normalized jobs."""
-    if isinstance(data, dict):
-        raw_jobs = data.get("jobs", data.get("data", data.get("results", [])))
-    elif isinstance(data, list):
-        raw_jobs = data
-    else:
-        return []
+    raw_jobs = extract_raw_jobs(data, "jobs", "data", "results")
 
     jobs: list[ParsedJob] = []
+    base_url = f"https://ats.rippling.com/{slug}/jobs/"
 
     for raw in raw_jobs:
         if not isinstance(raw, dict):
@@ -57,24 +68,17 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
         url = raw.get("url", "")
         if not url:
             job_id = raw.get("id") or raw.get("slug", "")
-            url = f"https://ats.rippling.com/{slug}/jobs/{job_id}"
+            url = f"{base_url}{job_id}"
 
         location = raw.get("location")
-        description = _clean_html(raw.get("description", ""))
+        description = clean_html(raw.get("description", ""))
 
         # Salary
         salary_min, salary_max, salary_currency = _extract_salary(raw.get("compensationRange"))
 
         # Remote
         workplace = (raw.get("workplaceType") or "").upper()
-        if workplace == "REMOTE":
-            remote_type = "remote"
-        elif workplace == "HYBRID":
-            remote_type = "hybrid"
-        elif workplace in ("ONSITE", "ON_SITE", "IN_OFFICE"):
-            remote_type = "onsite"
-        else:
-            remote_type = detect_remote_type(title, location, raw)
+        remote_type = _WORKPLACE_MAP.get(workplace) or detect_remote_type(title, location, raw)
 
         # Tags
         tags: list[str] = []
@@ -110,15 +114,7 @@ def _extract_salary(comp: Any) -> tuple[int | None, int | None, str]:
     currency = comp.get("currency", "USD") or "USD"
 
     return (
-        int(float(sal_min)) if sal_min else None,
-        int(float(sal_max)) if sal_max else None,
+        to_int(sal_min) if sal_min else None,
+        to_int(sal_max) if sal_max else None,
         currency,
     )
-
-
-def _clean_html(html: str) -> str:
-    if not html:
-        return ""
-    text = re.sub(r"<[^>]+>", " ", html)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
\ No newline at end of file
@@ -33,21 +33,23 @@ Response:
 
 from __future__ import annotations
 
-from typing import Any
+from functools import lru_cache
 
-from parsers import ParsedJob, detect_remote_type, detect_seniority
+from parsers import (
+    ParsedJob,
+    build_location,
+    detect_remote_type,
+    detect_seniority,
+    extract_raw_jobs,
+)
 
 
 def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
     """Parse SmartRecruiters API response into normalized jobs."""
-    if isinstance(data, dict):
-        raw_jobs = data.get("content", [])
-    elif isinstance(data, list):
-        raw_jobs = data
-    else:
-        return []
+    raw_jobs = extract_raw_jobs(data, "content")
 
     jobs: list[ParsedJob] = []
+    base_url = f"https://jobs.smartrecruiters.com/{slug}/"
 
     for raw in raw_jobs:
         if not isinstance(raw, dict):
@@ -58,10 +60,10 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
         if not title or not job_id:
             continue
 
-        url = f"https://jobs.smartrecruiters.com/{slug}/{job_id}"
+        url = f"{base_url}{job_id}"
 
         # Location
-        location = _build_location(raw.get("location"))
+        location = build_location(raw.get("location"))
 
         # Remote type
         loc_data = raw.get("location") or {}
@@ -101,26 +103,8 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
     return jobs
 
 
-def _build_location(loc: dict[str, Any] | None) -> str | None:
-    """Build location string from SmartRecruiters location object."""
-    if not loc or not isinstance(loc, dict):
-        return None
-
-    parts: list[str] = []
-    city = loc.get("city")
-    region = loc.get("region")
-    country = loc.get("country")
-
-    if city:
-        parts.append(city)
-    if region:
-        parts.append(region)
-    if country and not parts:
-        parts.append(country)
-
-    return ", ".join(parts) if parts else None
-
-
+# experienceLevel labels are a small fixed vocabulary ("Mid-Senior Level", ...)
+@lru_cache(maxsize=256)
 def _map_seniority(label: str) -> str | None:
     """Map SmartRecruiters experience level labels to our seniority values."""
     label_lower = label.lower()
@@ -136,4 +120,4 @@ def _map_seniority(label: str) -> str | None:
         return "director"
     if "manager" in label_lower:
         return "manager"
-    return None
\ No newline at end of file
+    return None
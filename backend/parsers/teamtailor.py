@@ -37,10 +37,17 @@ Response (JSON:API format):
 
 from __future__ import annotations
 
-import re
 from typing import Any
 
-from parsers import ParsedJob, detect_remote_type, detect_seniority
+from parsers import ParsedJob, clean_html, detect_remote_type, detect_seniority, to_int
+
+
+_REMOTE_STATUS_MAP: dict[str, str] = {
+    "fully": "remote",
+    "hybrid": "hybrid",
+    "none": "onsite",
+    "onsite": "onsite",
+}
 
 
 def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
@@ -53,9 +60,10 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
         return []
 
     # Build lookup for included resources (departments, locations)
-    included_map = _build_included_map(data.get("included", []))
+    included_names = _build_included_names(data.get("included", []))
 
     jobs: list[ParsedJob] = []
+    base_url = f"https://{slug}.teamtailor.com/jobs/"
 
     for raw in raw_jobs:
         if not isinstance(raw, dict):
@@ -74,34 +82,29 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
         url = links.get("careersite-job-url", "")
         if not url:
             job_id = raw.get("id", "")
-            url = f"https://{slug}.teamtailor.com/jobs/{job_id}"
+            url = f"{base_url}{job_id}"
 
         # Status filter
         if attrs.get("status") and attrs["status"] != "open":
             continue
 
         # Description
-        description = _clean_html(attrs.get("body", ""))
+        description = clean_html(attrs.get("body", ""))
 
         # Location from relationships
-        location = _resolve_location(raw, included_map)
+        location = _resolve_location(raw, included_names)
 
         # Salary
         salary_min, salary_max, salary_currency = _extract_salary(attrs.get("salary"))
 
         # Remote
         remote_status = (attrs.get("remote-status") or "").lower()
-        if remote_status == "fully":
-            remote_type = "remote"
-        elif remote_status == "hybrid":
-            remote_type = "hybrid"
-        elif remote_status in ("none", "onsite"):
-            remote_type = "onsite"
-        else:
-            remote_type = detect_remote_type(title, location, attrs)
+        remote_type = (
+            _REMOTE_STATUS_MAP.get(remote_status) or detect_remote_type(title, location, attrs)
+        )
 
         # Department from relationships
-        category = _resolve_department(raw, included_map)
+        category = _resolve_department(raw, included_names)
 
         # Tags
         tags: list[str] = attrs.get("tags", []) or []
@@ -128,43 +131,41 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
     return jobs
 
 
-def _build_included_map(included: list) -> dict[str, dict]:
-    """Build a {type:id -> attributes} map from JSON:API included resources."""
-    result: dict[str, dict] = {}
-    for item in included:
-        if isinstance(item, dict):
-            key = f"{item.get('type')}:{item.get('id')}"
-            result[key] = item.get("attributes", {})
-    return result
+def _build_included_names(included: list) -> dict[str, str]:
+    """
+    Build a {type:id -> name} map from JSON:API included resources. Only the
+    name attribute is ever read, so the attributes dicts are not kept.
+    """
+    return {
+        f"{item.get('type')}:{item.get('id')}": name
+        for item in included
+        if isinstance(item, dict)
+        and isinstance(attrs := item.get("attributes"), dict)
+        and (name := attrs.get("name"))
+    }
 
 
-def _resolve_location(raw: dict, included_map: dict) -> str | None:
+def _resolve_location(raw: dict, included_names: dict[str, str]) -> str | None:
     rels = raw.get("relationships", {})
     locations_rel = rels.get("locations", {})
     loc_data = locations_rel.get("data", [])
 
     if isinstance(loc_data, list):
-        names: list[str] = []
-        for loc in loc_data:
-            if isinstance(loc, dict):
-                key = f"{loc.get('type')}:{loc.get('id')}"
-                attrs = included_map.get(key, {})
-                name = attrs.get("name")
-                if name:
-                    names.append(name)
-        return ", ".join(names) if names else None
+        names = (
+            included_names.get(f"{loc.get('type')}:{loc.get('id')}")
+            for loc in loc_data if isinstance(loc, dict)
+        )
+        return ", ".join(name for name in names if name) or None
     return None
 
 
-def _resolve_department(raw: dict, included_map: dict) -> str | None:
+def _resolve_department(raw: dict, included_names: dict[str, str]) -> str | None:
     rels = raw.get("relationships", {})
     dept_rel = rels.get("department", {})
     dept_data = dept_rel.get("data")
 
     if isinstance(dept_data, dict):
-        key = f"{dept_data.get('type')}:{dept_data.get('id')}"
-        attrs = included_map.get(key, {})
-        return attrs.get("name")
+        return included_names.get(f"{dept_data.get('type')}:{dept_data.get('id')}")
     return None
 
 
@@ -177,15 +178,7 @@ def _extract_salary(salary: Any) -> tuple[int | None, int | None, str]:
     currency = salary.get("currency", "USD") or "USD"
 
     return (
-        int(float(sal_min)) if sal_min else None,
-        int(float(sal_max)) if sal_max else None,
+        to_int(sal_min) if sal_min else None,
+        to_int(sal_max) if sal_max else None,
         currency,
     )
-
-
-def _clean_html(html: str) -> str:
-    if not html:
-        return ""
-    text = re.sub(r"<[^>]+>", " ", html)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
\ No newline at end of file
@@ -32,21 +32,29 @@ Response:
 
 from __future__ import annotations
 
-from typing import Any
-
-from parsers import ParsedJob, detect_remote_type, detect_seniority
+from parsers import (
+    ParsedJob,
+    build_location,
+    detect_remote_type,
+    detect_seniority,
+    extract_raw_jobs,
+)
+
+
+_WORKPLACE_MAP: dict[str, str] = {
+    "remote": "remote",
+    "hybrid": "hybrid",
+    "onsite": "onsite",
+    "on-site": "onsite",
+}
 
 
 def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
     """Parse Workable API response into normalized jobs."""
-    if isinstance(data, dict):
-        raw_jobs = data.get("results", data.get("jobs", []))
-    elif isinstance(data, list):
-        raw_jobs = data
-    else:
-        return []
+    raw_jobs = extract_raw_jobs(data, "results", "jobs")
 
     jobs: list[ParsedJob] = []
+    base_url = f"https://apply.workable.com/{slug}/j/"
 
     for raw in raw_jobs:
         if not isinstance(raw, dict):
@@ -59,24 +67,20 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
 
         # Build full URL if relative
         if not url.startswith("http"):
-            url = f"https://apply.workable.com/{slug}/j/{raw.get('shortcode', '')}/"
+            url = f"{base_url}{raw.get('shortcode', '')}/"
 
         # Location
-        location = _build_location(raw.get("location"))
+        location = build_location(raw.get("location"))
 
         # Remote type — Workable has workplace field
         workplace = (raw.get("workplace") or "").lower()
         loc_data = raw.get("location") or {}
         telecommuting = loc_data.get("telecommuting", False) if isinstance(loc_data, dict) else False
 
-        if workplace == "remote" or telecommuting:
-            remote_type = "remote"
-        elif workplace == "hybrid":
-            remote_type = "hybrid"
-        elif workplace in ("onsite", "on-site"):
-            remote_type = "onsite"
-        else:
-            remote_type = detect_remote_type(title, location, raw)
+        remote_type = (
+            ("remote" if telecommuting else _WORKPLACE_MAP.get(workplace))
+            or detect_remote_type(title, location, raw)
+        )
 
         # Posted date
         posted_at = raw.get("published") or raw.get("created")
@@ -95,23 +99,3 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
         ))
 
     return jobs
-
-
-def _build_location(loc: dict[str, Any] | None) -> str | None:
-    """Build location string from Workable location object."""
-    if not loc or not isinstance(loc, dict):
-        return None
-
-    parts: list[str] = []
-    city = loc.get("city")
-    region = loc.get("region")
-    country = loc.get("country")
-
-    if city:
-        parts.append(city)
-    if region:
-        parts.append(region)
-    if country and not parts:
-        parts.append(country)
-
-    return ", ".join(parts) if parts else None
\ No newline at end of file
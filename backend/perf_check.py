@@ -9,8 +9,11 @@ Usage:
 
 from __future__ import annotations
 
-import time
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
 
 try:
     from dotenv import load_dotenv
@@ -18,131 +21,119 @@ try:
 except ImportError:
     pass
 
+from supabase import Client
+
 import db
 from config import LOG_FORMAT, LOG_LEVEL
 
 logging.basicConfig(format=LOG_FORMAT, level=LOG_LEVEL)
 logger = logging.getLogger(__name__)
 
+# A timed query: runs one request on the given (already warmed) client
+Query = Callable[[Client], Any]
 
-def time_query(name: str, fn) -> float:
+
+def time_query(fn: Query, client: Client) -> float:
     start = time.monotonic()
-    fn()
+    fn(client)
     elapsed = (time.monotonic() - start) * 1000
     return elapsed
 
 
-def main() -> None:
-    logger.info("=== PERFORMANCE CHECK ===\n")
-    client = db.get_client()
-
-    tests: list[tuple[str, float]] = []
-
-    # 1. Job listing page 1
-    logger.info("Job Listing Queries:")
+def _warm_up(client: Client) -> None:
+    """One throwaway request, so connection setup isn't part of any timing."""
+    client.table("scrape_runs").select("id").limit(1).execute()
 
-    t = time_query("Active jobs page 1", lambda: (
-        client.table("jobs").select("*", count="exact")
-        .eq("is_active", True)
-        .order("first_seen", desc=True)
-        .range(0, 29)
-        .execute()
-    ))
-    tests.append(("Active jobs page 1", t))
 
-    # 2. Search (using ilike as proxy for text_search)
-    t = time_query("Search: title ilike 'react'", lambda: (
-        client.table("jobs").select("*", count="exact")
-        .eq("is_active", True)
-        .ilike("title", "%react%")
-        .order("first_seen", desc=True)
-        .range(0, 29)
-        .execute()
-    ))
-    tests.append(("Search 'react'", t))
+def _time_on_warm_client(fn: Query, ready: threading.Barrier) -> float:
+    """
+    Time fn on this worker thread's client. The client is created and warmed
+    first, and every worker waits at `ready` so all timings start together.
+    """
+    try:
+        client = db.get_client()
+        _warm_up(client)
+    except BaseException:
+        ready.abort()  # release the other workers instead of hanging
+        raise
+    ready.wait()
+    return time_query(fn, client)
 
-    # 3. Filter: remote
-    t = time_query("Filter: remote", lambda: (
-        client.table("jobs").select("*", count="exact")
-        .eq("is_active", True)
-        .eq("remote_type", "remote")
-        .order("first_seen", desc=True)
-        .range(0, 29)
-        .execute()
-    ))
-    tests.append(("Filter remote", t))
 
-    # 4. Filter: ATS
-    t = time_query("Filter: greenhouse", lambda: (
-        client.table("jobs").select("*", count="exact")
-        .eq("is_active", True)
-        .eq("ats_source", "greenhouse")
-        .order("first_seen", desc=True)
-        .range(0, 29)
-        .execute()
-    ))
-    tests.append(("Filter greenhouse", t))
+def _job_listing(**filters: Any) -> Query:
+    """Page 1 of the frontend job listing with the given .eq filters."""
+    def run(client: Client) -> Any:
+        query = client.table("jobs").select("*", count="exact").eq("is_active", True)
+        for column, value in filters.items():
+            query = query.eq(column, value)
+        return query.order("first_seen", desc=True).range(0, 29).execute()
+    return run
 
-    # 5. Filter: location
-    t = time_query("Filter: San Francisco", lambda: (
-        client.table("jobs").select("*", count="exact")
-        .eq("is_active", True)
-        .ilike("location", "%San Francisco%")
-        .order("first_seen", desc=True)
-        .range(0, 29)
-        .execute()
-    ))
-    tests.append(("Filter location", t))
 
-    # 6. Combined
-    t = time_query("Combined: remote + greenhouse", lambda: (
+def _job_search(column: str, pattern: str) -> Query:
+    """Page 1 of the frontend job listing filtered by `column` ilike `pattern`."""
+    return lambda client: (
         client.table("jobs").select("*", count="exact")
         .eq("is_active", True)
-        .eq("remote_type", "remote")
-        .eq("ats_source", "greenhouse")
+        .ilike(column, pattern)
         .order("first_seen", desc=True)
         .range(0, 29)
         .execute()
-    ))
-    tests.append(("Combined filters", t))
-
-    # 7. Counts
-    logger.info("\nCount Queries:")
-
-    t = time_query("Active job count", lambda: (
-        client.table("jobs").select("id", count="exact", head=True)
-        .eq("is_active", True)
-        .execute()
-    ))
-    tests.append(("Job count", t))
+    )
 
-    t = time_query("Verified company count", lambda: (
-        client.table("companies").select("id", count="exact", head=True)
-        .eq("verified", True)
-        .execute()
-    ))
-    tests.append(("Company count", t))
 
-    # 8. Single job (modal)
-    logger.info("\nSingle Record:")
+def main() -> None:
+    logger.info("=== PERFORMANCE CHECK ===\n")
 
+    # Independent read-only queries, issued together
+    queries: list[tuple[str, Query]] = [
+        # Job listing
+        ("Active jobs page 1", _job_listing()),
+        # Search (using ilike as proxy for text_search)
+        ("Search 'react'", _job_search("title", "%react%")),
+        ("Filter remote", _job_listing(remote_type="remote")),
+        ("Filter greenhouse", _job_listing(ats_source="greenhouse")),
+        ("Filter location", _job_search("location", "%San Francisco%")),
+        ("Combined filters", _job_listing(remote_type="remote", ats_source="greenhouse")),
+        # Counts
+        ("Job count", lambda client: (
+            client.table("jobs").select("id", count="exact", head=True)
+            .eq("is_active", True)
+            .execute()
+        )),
+        ("Company count", lambda client: (
+            client.table("companies").select("id", count="exact", head=True)
+            .eq("verified", True)
+            .execute()
+        )),
+        ("Latest scrape run", lambda client: (
+            client.table("scrape_runs").select("*")
+            .order("started_at", desc=True)
+            .limit(1)
+            .execute()
+        )),
+    ]
+    logger.info("Running %d queries concurrently...", len(queries))
+    # One thread per query; db clients are per thread, and the barrier keeps
+    # every worker (and so every client) alive until all are warmed
+    ready = threading.Barrier(len(queries))
+    with ThreadPoolExecutor(max_workers=len(queries), thread_name_prefix="perf") as pool:
+        futures = [pool.submit(_time_on_warm_client, fn, ready) for _, fn in queries]
+        tests: list[tuple[str, float]] = [
+            (name, f.result()) for (name, _), f in zip(queries, futures)
+        ]
+
+    # Single job (modal) depends on a sample id, so it runs afterwards
+    # (the sample query also warms this thread's client)
+    client = db.get_client()
     sample = client.table("jobs").select("id").eq("is_active", True).limit(1).execute()
     if sample.data:
         job_id = sample.data[0]["id"]
-        t = time_query("Single job by ID", lambda: (
-            client.table("jobs").select("*").eq("id", job_id).single().execute()
-        ))
+        t = time_query(lambda c: (
+            c.table("jobs").select("*").eq("id", job_id).single().execute()
+        ), client)
         tests.append(("Single job fetch", t))
 
-    # 9. Scrape run
-    t = time_query("Latest scrape run", lambda: (
-        client.table("scrape_runs").select("*")
-        .order("started_at", desc=True)
-        .limit(1)
-        .execute()
-    ))
-    tests.append(("Latest scrape run", t))
-
     # Summary
     logger.info("\n=== RESULTS ===")
     for name, ms in tests:
@@ -156,8 +147,9 @@ def main() -> None:
             status = "❌"
         logger.info("  %s %-35s %6.0fms", status, name, ms)
 
-    total_jobs = db.get_job_count(active_only=True)
-    total_companies = db.get_company_count()
+    total_jobs, total_companies = db.fetch_concurrently(
+        lambda: db.get_job_count(active_only=True), db.get_company_count,
+    )
     logger.info("\n  DB size: %d active jobs, %d companies", total_jobs, total_companies)
 
     slow = [n for n, ms in tests if ms >= 500]
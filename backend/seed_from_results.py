@@ -16,20 +16,30 @@ Usage:
 
     # Also seed jobs (not just companies):
     python seed_from_results.py --data-dir ../data --seed-jobs
+
+    # Ignore cached extractions from earlier runs:
+    python seed_from_results.py --data-dir ../data --no-cache
 """
 
 from __future__ import annotations
 
 import argparse
-import glob
-import json
+import hashlib
 import logging
 import os
+import pickle
 import re
 import sys
-from dataclasses import dataclass, field
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from fnmatch import fnmatchcase
+from functools import lru_cache
 from pathlib import Path
-from urllib.parse import urlparse
+from typing import Any
+
+import orjson
 
 # Load .env before importing config
 try:
@@ -40,12 +50,13 @@ except ImportError:
 
 from config import (
     ATS_API_TEMPLATES,
-    ATS_DOMAIN_MAP,
+    COMPILED_SLUG_PATTERNS,
     DATA_DIR,
     LOG_FORMAT,
     LOG_LEVEL,
-    SLUG_PATTERNS,
-    SlugPattern,
+    detect_ats_domain,
+    url_host_path,
+    url_hostname,
 )
 import db
 
@@ -57,7 +68,7 @@ logger = logging.getLogger(__name__)
 # Slug extraction
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedCompany:
     """A company slug extracted from a job URL."""
     slug: str
@@ -69,15 +80,7 @@ class ExtractedCompany:
 
 def detect_ats_from_url(url: str) -> str | None:
     """Detect the ATS platform from a URL using domain mapping."""
-    parsed = urlparse(url.lower())
-    hostname = parsed.hostname or ""
-
-    # Check domain map from most specific to least specific
-    # Sort by length descending so "boards.greenhouse.io" matches before "greenhouse.io"
-    for domain, ats in sorted(ATS_DOMAIN_MAP.items(), key=lambda x: -len(x[0])):
-        if domain in hostname:
-            return ats
-    return None
+    return detect_ats_domain(url_hostname(url))
 
 
 def extract_slug_from_url(url: str) -> ExtractedCompany | None:
@@ -90,52 +93,42 @@ def extract_slug_from_url(url: str) -> ExtractedCompany | None:
         stripe.recruitee.com/o/job-title    → recruitee:stripe
         apply.workable.com/figma/j/abc      → workable:figma
     """
-    parsed = urlparse(url.strip())
-    hostname = (parsed.hostname or "").lower()
-    path_parts = [p for p in parsed.path.strip("/").split("/") if p]
+    url = url.strip()
+    match = _extract_slug(*url_host_path(url))
+    if match is None:
+        return None
+    slug, ats = match
+    return ExtractedCompany(slug=slug, ats=ats, careers_url=url)
 
-    for pattern in SLUG_PATTERNS:
-        if pattern.domain_contains not in hostname:
-            continue
 
-        slug: str | None = None
-
-        if pattern.strategy.startswith("path:"):
-            idx = int(pattern.strategy.split(":")[1])
-            if len(path_parts) > idx:
-                slug = path_parts[idx]
-
-        elif pattern.strategy == "subdomain":
-            # e.g., stripe.recruitee.com → "stripe"
-            parts = hostname.split(".")
-            # Find the domain_contains portion and take what's before it
-            domain_base = pattern.domain_contains.split(".")[0]
-            for i, part in enumerate(parts):
-                if part == domain_base:
-                    if i > 0:
-                        slug = parts[0]
-                    break
-
-        elif pattern.strategy.startswith("path_after:"):
-            marker = pattern.strategy.split(":")[1]
-            for i, part in enumerate(path_parts):
-                if part.lower() == marker and i + 1 < len(path_parts):
-                    slug = path_parts[i + 1]
-                    break
+@lru_cache(maxsize=65536)
+def _extract_slug(hostname: str, path: str) -> tuple[str, str] | None:
+    """
+    Return the cleaned (slug, ats) for a hostname and URL path, or None.
+    Cached and returned as a tuple since ExtractedCompany is mutable.
+    """
+    path_parts = [p for p in path.strip("/").split("/") if p]
 
+    for ats, domain_contains, extract in COMPILED_SLUG_PATTERNS:
+        if domain_contains not in hostname:
+            continue
+
+        slug = extract(hostname, path_parts)
         if slug:
             # Clean slug
             slug = clean_slug(slug)
             if slug and is_valid_slug(slug):
-                return ExtractedCompany(
-                    slug=slug,
-                    ats=pattern.ats,
-                    careers_url=url.strip(),
-                )
+                return slug, ats
 
     return None
 
 
+_SLUG_SUFFIX_RE = re.compile(r"/(jobs|careers|openings|positions)$")
+_VALID_SLUG_RE = re.compile(r"^[a-z0-9][a-z0-9\-_\.]*[a-z0-9]$")
+_NON_SLUG_RE = re.compile(r"[^a-z0-9]+")
+_DOLLAR_AMOUNT_RE = re.compile(r"\$([\d,]+\.?\d*)([kK]?)")
+
+
 def clean_slug(slug: str) -> str:
     """Normalize a slug: lowercase, strip whitespace, remove trailing garbage."""
     slug = slug.lower().strip()
@@ -144,10 +137,19 @@ def clean_slug(slug: str) -> str:
     slug = slug.split("#")[0]
     slug = slug.rstrip("/")
     # Remove trailing /jobs, /careers, etc. that got included
-    slug = re.sub(r"/(jobs|careers|openings|positions)$", "", slug)
+    slug = _SLUG_SUFFIX_RE.sub("", slug)
     return slug
 
 
+_SLUG_BLACKLIST: frozenset[str] = frozenset({
+    "jobs", "careers", "openings", "apply", "posting", "postings",
+    "boards", "board", "api", "v0", "v1", "v2", "v3",
+    "search", "results", "category", "department", "location",
+    "www", "app", "help", "support", "about", "blog",
+    "undefined", "null", "none", "test", "example", "demo",
+})
+
+
 def is_valid_slug(slug: str) -> bool:
     """Check if an extracted slug looks like a real company slug."""
     if not slug:
@@ -157,17 +159,10 @@ def is_valid_slug(slug: str) -> bool:
     if len(slug) > 100:
         return False
     # Must be alphanumeric with hyphens/underscores (typical ATS slug format)
-    if not re.match(r"^[a-z0-9][a-z0-9\-_\.]*[a-z0-9]$", slug) and len(slug) > 2:
+    if not _VALID_SLUG_RE.match(slug) and len(slug) > 2:
         return False
     # Filter out common non-company slugs
-    blacklist = {
-        "jobs", "careers", "openings", "apply", "posting", "postings",
-        "boards", "board", "api", "v0", "v1", "v2", "v3",
-        "search", "results", "category", "department", "location",
-        "www", "app", "help", "support", "about", "blog",
-        "undefined", "null", "none", "test", "example", "demo",
-    }
-    if slug in blacklist:
+    if slug in _SLUG_BLACKLIST:
         return False
     return True
 
@@ -179,44 +174,56 @@ def is_valid_slug(slug: str) -> bool:
 def read_json_file(filepath: Path) -> dict | list | None:
     """Safely read and parse a JSON file."""
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError) as e:
+        return orjson.loads(filepath.read_bytes())
+    except (orjson.JSONDecodeError, OSError) as e:
         logger.error("Failed to read %s: %s", filepath, e)
         return None
 
 
-def extract_from_google_results(filepath: Path) -> list[ExtractedCompany]:
-    """
-    Extract companies from Google dorked job results.
-    Expected format: { meta: {...}, results: [{ title, url, company, platform, ... }] }
-    """
+def read_results(filepath: Path) -> list:
+    """The `results` list of a scrape result file, or [] if unreadable."""
     data = read_json_file(filepath)
     if not data or not isinstance(data, dict):
         return []
+    return data.get("results", [])
+
 
-    results = data.get("results", [])
+def extract_from_google_results(filepath: Path, results: list | None = None) -> list[ExtractedCompany]:
+    """
+    Extract companies from Google dorked job results.
+    Expected format: { meta: {...}, results: [{ title, url, company, platform, ... }] }
+    """
+    if results is None:
+        results = read_results(filepath)
     companies: list[ExtractedCompany] = []
+    source_file = sys.intern(filepath.name)
+    # url -> whether it came with a company name. A repeat only matters if
+    # it adds a name the first sighting lacked (dedup prefers named entries).
+    seen_urls: dict[str, bool] = {}
 
     for result in results:
         url = result.get("url", "")
         if not url:
             continue
 
+        name = result.get("company")
+        if url in seen_urls and (seen_urls[url] or not name):
+            continue
+        seen_urls[url] = bool(name)
+
         extracted = extract_slug_from_url(url)
         if extracted:
             # Use the company name from the result if available
-            name = result.get("company")
             if name:
                 extracted.name = name.strip()
-            extracted.source_file = filepath.name
+            extracted.source_file = source_file
             companies.append(extracted)
 
-    logger.info("Extracted %d companies from %s (%d results)", len(companies), filepath.name, len(results))
+    logger.info("Extracted %d companies from %s (%d results)", len(companies), source_file, len(results))
     return companies
 
 
-def extract_from_linkedin_results(filepath: Path) -> list[ExtractedCompany]:
+def extract_from_linkedin_results(filepath: Path, results: list | None = None) -> list[ExtractedCompany]:
     """
     Extract companies from LinkedIn scrape results.
     These are LinkedIn jobs, so no ATS slug — but company names are useful
@@ -224,32 +231,33 @@ def extract_from_linkedin_results(filepath: Path) -> list[ExtractedCompany]:
 
     Expected format: { meta: {...}, results: [{ title, url, company, platform, location, ... }] }
     """
-    data = read_json_file(filepath)
-    if not data or not isinstance(data, dict):
-        return []
-
-    results = data.get("results", [])
+    if results is None:
+        results = read_results(filepath)
     companies: list[ExtractedCompany] = []
+    source_file = sys.intern(filepath.name)
+    # The slug comes from the name alone, so only a name's first row counts
+    seen_names: set[str] = set()
 
     for result in results:
         company_name = result.get("company", "").strip()
         url = result.get("url", "")
-        if not company_name:
+        if not company_name or company_name in seen_names:
             continue
+        seen_names.add(company_name)
 
         # LinkedIn URLs don't give us ATS slugs, but we can record the company
         # name for later cross-referencing when probing ATS APIs
-        slug = re.sub(r"[^a-z0-9]+", "-", company_name.lower()).strip("-")
+        slug = _NON_SLUG_RE.sub("-", company_name.lower()).strip("-")
         if slug and is_valid_slug(slug):
             companies.append(ExtractedCompany(
                 slug=slug,
                 ats="linkedin",
                 name=company_name,
                 careers_url=url,
-                source_file=filepath.name,
+                source_file=source_file,
             ))
 
-    logger.info("Extracted %d company names from LinkedIn file %s", len(companies), filepath.name)
+    logger.info("Extracted %d company names from LinkedIn file %s", len(companies), source_file)
     return companies
 
 
@@ -272,7 +280,7 @@ def extract_from_ats_platforms(filepath: Path) -> list[dict]:
 # Job seeding (optional)
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedJob:
     """A job extracted from existing results."""
     url: str
@@ -288,13 +296,10 @@ class ExtractedJob:
     platform: str | None = None
 
 
-def extract_jobs_from_google_results(filepath: Path) -> list[ExtractedJob]:
+def extract_jobs_from_google_results(filepath: Path, results: list | None = None) -> list[ExtractedJob]:
     """Extract job records from Google dorked results."""
-    data = read_json_file(filepath)
-    if not data or not isinstance(data, dict):
-        return []
-
-    results = data.get("results", [])
+    if results is None:
+        results = read_results(filepath)
     jobs: list[ExtractedJob] = []
 
     for r in results:
@@ -325,13 +330,10 @@ def extract_jobs_from_google_results(filepath: Path) -> list[ExtractedJob]:
     return jobs
 
 
-def extract_jobs_from_linkedin_results(filepath: Path) -> list[ExtractedJob]:
+def extract_jobs_from_linkedin_results(filepath: Path, results: list | None = None) -> list[ExtractedJob]:
     """Extract job records from LinkedIn results."""
-    data = read_json_file(filepath)
-    if not data or not isinstance(data, dict):
-        return []
-
-    results = data.get("results", [])
+    if results is None:
+        results = read_results(filepath)
     jobs: list[ExtractedJob] = []
 
     for r in results:
@@ -364,6 +366,28 @@ def extract_jobs_from_linkedin_results(filepath: Path) -> list[ExtractedJob]:
     return jobs
 
 
+def extract_all_from_google_results(
+    filepath: Path,
+) -> tuple[list[ExtractedCompany], list[ExtractedJob]]:
+    """Companies and jobs from a Google results file, reading it once."""
+    results = read_results(filepath)
+    return (
+        extract_from_google_results(filepath, results),
+        extract_jobs_from_google_results(filepath, results),
+    )
+
+
+def extract_all_from_linkedin_results(
+    filepath: Path,
+) -> tuple[list[ExtractedCompany], list[ExtractedJob]]:
+    """Companies and jobs from a LinkedIn results file, reading it once."""
+    results = read_results(filepath)
+    return (
+        extract_from_linkedin_results(filepath, results),
+        extract_jobs_from_linkedin_results(filepath, results),
+    )
+
+
 def parse_salary(salary_str: str | None) -> tuple[int | None, int | None]:
     """
     Parse salary strings like "$120K - $180K", "$100,000 - $150,000".
@@ -372,18 +396,14 @@ def parse_salary(salary_str: str | None) -> tuple[int | None, int | None]:
     if not salary_str:
         return None, None
 
-    # Find all dollar amounts
-    amounts = re.findall(r"\$[\d,]+\.?\d*[kK]?", salary_str)
-    if not amounts:
-        return None, None
-
+    # Find all dollar amounts as (number, "k" suffix or "")
     parsed: list[int] = []
-    for amt in amounts:
-        amt = amt.replace("$", "").replace(",", "")
-        if amt.lower().endswith("k"):
-            parsed.append(int(float(amt[:-1]) * 1000))
-        else:
-            parsed.append(int(float(amt)))
+    for amount, suffix in _DOLLAR_AMOUNT_RE.findall(salary_str):
+        try:
+            value = float(amount.replace(",", ""))
+        except ValueError:  # a bare "$," run
+            continue
+        parsed.append(int(value * 1000) if suffix else int(value))
 
     if len(parsed) >= 2:
         return min(parsed), max(parsed)
@@ -396,12 +416,17 @@ def parse_salary(salary_str: str | None) -> tuple[int | None, int | None]:
 # Deduplication and API URL generation
 # ---------------------------------------------------------------------------
 
-def deduplicate_companies(companies: list[ExtractedCompany]) -> dict[str, ExtractedCompany]:
+def deduplicate_companies(
+    companies: Iterable[ExtractedCompany],
+    seen: dict[str, ExtractedCompany] | None = None,
+) -> dict[str, ExtractedCompany]:
     """
     Deduplicate by (ats, slug) key.
     Keeps the entry with the most info (name populated, etc.).
+    Pass `seen` to fold another batch into an earlier result.
     """
-    seen: dict[str, ExtractedCompany] = {}
+    if seen is None:
+        seen = {}
 
     for c in companies:
         key = f"{c.ats}:{c.slug}"
@@ -428,6 +453,74 @@ def generate_api_url(ats: str, slug: str) -> str | None:
 # Main seeding logic
 # ---------------------------------------------------------------------------
 
+# Seeded jobs per batch_insert_jobs call handed to the DB thread
+JOB_BATCH_SIZE = 500
+
+# Bump when extraction rules change so stale cached results are not reused
+_EXTRACT_CACHE_VERSION = 1
+
+
+def _extract_files(
+    google_files: list[Path],
+    linkedin_files: list[Path],
+    google_fn: Callable[[Path], Any],
+    linkedin_fn: Callable[[Path], Any],
+    cache_dir: Path | None = None,
+) -> Iterator[Any]:
+    """
+    Run the per-file extractors, one file per worker process, yielding each
+    file's results as they are ready.
+
+    Each file is an independent JSON parse plus regex pass, so they spread
+    across cores. Results come back in file order, keeping dedup (first
+    entry wins) deterministic. With `cache_dir`, unchanged files reuse the
+    results of a previous run.
+    """
+    fns = [google_fn] * len(google_files) + [linkedin_fn] * len(linkedin_files)
+    files = google_files + linkedin_files
+    cache_dirs = [cache_dir] * len(files)
+    if len(files) <= 1:
+        yield from map(_cached_extract, fns, files, cache_dirs)
+        return
+    with ProcessPoolExecutor(max_workers=min(len(files), os.cpu_count() or 1)) as pool:
+        yield from pool.map(_cached_extract, fns, files, cache_dirs)
+
+
+def _cached_extract(fn: Callable[[Path], Any], filepath: Path, cache_dir: Path | None) -> Any:
+    """
+    fn(filepath), reusing a pickled result from `cache_dir` while the file's
+    size and mtime are unchanged.
+    """
+    if cache_dir is None:
+        return fn(filepath)
+    try:
+        st = filepath.stat()
+    except OSError:
+        return fn(filepath)
+
+    key = f"{_EXTRACT_CACHE_VERSION}:{fn.__name__}:{filepath.name}:{st.st_size}:{st.st_mtime_ns}"
+    cache_path = cache_dir / f"{hashlib.sha1(key.encode()).hexdigest()}.pkl"
+    try:
+        result = pickle.loads(cache_path.read_bytes())
+        logger.info("Using cached extraction for %s", filepath.name)
+        return result
+    except FileNotFoundError:
+        pass
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError) as e:
+        logger.warning("Ignoring unreadable extract cache %s: %s", cache_path.name, e)
+
+    result = fn(filepath)
+    try:
+        cache_dir.mkdir(exist_ok=True)
+        # Write then rename, so an interrupted run never leaves a torn entry
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+        tmp_path.replace(cache_path)
+    except OSError as e:
+        logger.warning("Could not write extract cache for %s: %s", filepath.name, e)
+    return result
+
+
 def scan_data_directory(data_dir: Path, file_glob: str = "*") -> tuple[list[Path], list[Path], list[Path]]:
     """
     Scan data directory and categorize files.
@@ -437,7 +530,21 @@ def scan_data_directory(data_dir: Path, file_glob: str = "*") -> tuple[list[Path
     linkedin_files: list[Path] = []
     ats_files: list[Path] = []
 
-    for filepath in sorted(data_dir.glob(f"{file_glob}.json" if not file_glob.endswith(".json") else file_glob)):
+    pattern = file_glob if file_glob.endswith(".json") else f"{file_glob}.json"
+    if "/" in pattern or os.sep in pattern:
+        # Patterns reaching into subdirectories still need a real glob
+        filepaths = sorted(data_dir.glob(pattern))
+    else:
+        # One directory read; DirEntry answers is_file() without a stat call
+        with os.scandir(data_dir) as it:
+            filepaths = sorted(
+                data_dir / entry.name
+                for entry in it
+                if fnmatchcase(entry.name, pattern) and entry.is_file()
+            )
+
+    # Sorted so dedup (first entry wins) picks the same rows on every run
+    for filepath in filepaths:
         name = filepath.name.lower()
         if "linkedin" in name:
             linkedin_files.append(filepath)
@@ -454,9 +561,12 @@ def seed_companies(
     file_glob: str = "*",
     dry_run: bool = False,
     seed_jobs: bool = False,
+    use_cache: bool = True,
 ) -> None:
     """
     Main entry point: scan JSON files, extract companies, seed to Supabase.
+    Per-file extractions are cached under data_dir/.extract_cache unless
+    use_cache is False.
     """
     google_files, linkedin_files, ats_files = scan_data_directory(data_dir, file_glob)
 
@@ -468,120 +578,137 @@ def seed_companies(
         logger.warning("No JSON files found in %s — nothing to seed", data_dir)
         return
 
-    # -----------------------------------------------------------------------
-    # Phase 1: Extract companies from all files
-    # -----------------------------------------------------------------------
-    all_companies: list[ExtractedCompany] = []
-
-    for fp in google_files:
-        all_companies.extend(extract_from_google_results(fp))
-
-    for fp in linkedin_files:
-        all_companies.extend(extract_from_linkedin_results(fp))
-
-    logger.info("Total raw extractions: %d", len(all_companies))
-
-    # Deduplicate
-    unique = deduplicate_companies(all_companies)
-    logger.info("Unique companies after dedup: %d", len(unique))
-
-    # Split: ATS companies (have API URLs) vs LinkedIn-only (need probing later)
-    ats_companies = {k: v for k, v in unique.items() if v.ats != "linkedin"}
-    linkedin_companies = {k: v for k, v in unique.items() if v.ats == "linkedin"}
-
-    logger.info("  ATS companies (with API URLs): %d", len(ats_companies))
-    logger.info("  LinkedIn-only companies (need probing): %d", len(linkedin_companies))
-
-    # Print ATS breakdown
-    ats_counts: dict[str, int] = {}
-    for c in ats_companies.values():
-        ats_counts[c.ats] = ats_counts.get(c.ats, 0) + 1
-    for ats, count in sorted(ats_counts.items(), key=lambda x: -x[1]):
-        logger.info("    %s: %d", ats, count)
-
-    if dry_run:
-        logger.info("DRY RUN — not writing to database")
-        _print_sample(ats_companies, linkedin_companies)
-        return
-
-    # -----------------------------------------------------------------------
-    # Phase 2: Upsert ATS companies to Supabase
-    # -----------------------------------------------------------------------
-    run_id = db.start_scrape_run(
-        source="seed_from_results",
-        job_title="company seeding",
-        config={"data_dir": str(data_dir), "file_glob": file_glob},
-    )
-
-    upserted = 0
-    errors = 0
-
-    for key, company in ats_companies.items():
-        api_url = generate_api_url(company.ats, company.slug)
-        result = db.upsert_company(
-            slug=company.slug,
-            ats=company.ats,
-            name=company.name,
-            api_url=api_url,
-            careers_url=company.careers_url,
-            source=f"seed:{company.source_file}",
+    run_id: str | None = None
+    db_pool: ThreadPoolExecutor | None = None
+    if not dry_run:
+        run_id = db.start_scrape_run(
+            source="seed_from_results",
+            job_title="company seeding",
+            config={"data_dir": str(data_dir), "file_glob": file_glob},
         )
-        if result:
-            upserted += 1
-        else:
-            errors += 1
-
-    logger.info("Upserted %d ATS companies (%d errors)", upserted, errors)
-
-    # Also seed LinkedIn company names (marked as unverified, no API URL)
-    # These will be probed by discover_companies.py later
-    linkedin_upserted = 0
-    for key, company in linkedin_companies.items():
-        result = db.upsert_company(
-            slug=company.slug,
-            ats="linkedin",
-            name=company.name,
-            careers_url=company.careers_url,
-            source=f"seed:{company.source_file}",
-        )
-        if result:
-            linkedin_upserted += 1
-
-    logger.info("Upserted %d LinkedIn company references", linkedin_upserted)
+        # A single worker keeps writes ordered and on one Supabase client,
+        # while extraction of the remaining files carries on.
+        db_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db")
+
+    ats_writes: list[Future[list[dict[str, Any]]]] = []
+    linkedin_writes: list[Future[list[dict[str, Any]]]] = []
+    job_writes: list[Future[tuple[int, int]]] = []
+    written: set[str] = set()
+
+    def write_companies(keys: Iterable[str]) -> None:
+        """Queue upserts of unique[key] for each key on the DB thread."""
+        ats_rows: list[dict[str, Any]] = []
+        linkedin_rows: list[dict[str, Any]] = []
+        for key in keys:
+            written.add(key)
+            company = unique[key]
+            if company.ats == "linkedin":
+                linkedin_rows.append(_company_row(company))
+            else:
+                ats_rows.append(_company_row(company))
+        if ats_rows:
+            ats_writes.append(db_pool.submit(db.upsert_companies, ats_rows))
+        if linkedin_rows:
+            linkedin_writes.append(db_pool.submit(db.upsert_companies, linkedin_rows))
 
-    # -----------------------------------------------------------------------
-    # Phase 3: Optionally seed jobs
-    # -----------------------------------------------------------------------
-    new_jobs = 0
-    if seed_jobs:
-        logger.info("Seeding jobs from result files...")
-        all_jobs: list[ExtractedJob] = []
-
-        for fp in google_files:
-            all_jobs.extend(extract_jobs_from_google_results(fp))
-        for fp in linkedin_files:
-            all_jobs.extend(extract_jobs_from_linkedin_results(fp))
-
-        logger.info("Total jobs to seed: %d", len(all_jobs))
-
-        for job in all_jobs:
-            _, is_new = db.upsert_job(
-                url=job.url,
-                title=job.title,
-                ats_source=job.ats_source,
-                company_name=job.company_name,
-                location=job.location,
-                salary_min=job.salary_min,
-                salary_max=job.salary_max,
-                remote_type=job.remote_type,
-                easy_apply=job.easy_apply,
-                category=job.category,
-                platform=job.platform,
-            )
-            if is_new:
-                new_jobs += 1
-
-        logger.info("Seeded %d new jobs", new_jobs)
+    try:
+        # -------------------------------------------------------------------
+        # Phase 1: Extract companies from all files
+        # -------------------------------------------------------------------
+        # Deduplicate file by file as results arrive, so only one file's
+        # extractions are held at a time
+        unique: dict[str, ExtractedCompany] = {}
+        raw_count = 0
+        # With --seed-jobs, jobs come out of the same pass so each file is
+        # only read and decoded once
+        pending_jobs: list[dict[str, Any]] = []
+        job_count = 0
+        fuse_jobs = seed_jobs and not dry_run
+
+        for extracted in _extract_files(
+            google_files, linkedin_files,
+            extract_all_from_google_results if fuse_jobs else extract_from_google_results,
+            extract_all_from_linkedin_results if fuse_jobs else extract_from_linkedin_results,
+            cache_dir=data_dir / ".extract_cache" if use_cache else None,
+        ):
+            if fuse_jobs:
+                companies, jobs = extracted
+                job_count += len(jobs)
+                pending_jobs.extend(asdict(job) for job in jobs)
+                if len(pending_jobs) >= JOB_BATCH_SIZE:
+                    job_writes.append(db_pool.submit(db.batch_insert_jobs, pending_jobs))
+                    pending_jobs = []
+            else:
+                companies = extracted
+            raw_count += len(companies)
+            deduplicate_companies(companies, unique)
+
+            if db_pool is not None:
+                # Dedup never replaces a named entry, so those are final and
+                # can be written while later files are still extracting
+                write_companies([
+                    key for c in companies
+                    if c.name
+                    and (key := f"{c.ats}:{c.slug}") not in written
+                    and unique[key] is c
+                ])
+
+        logger.info("Total raw extractions: %d", raw_count)
+        logger.info("Unique companies after dedup: %d", len(unique))
+
+        # Split: ATS companies (have API URLs) vs LinkedIn-only (need probing later)
+        ats_companies = {k: v for k, v in unique.items() if v.ats != "linkedin"}
+        linkedin_companies = {k: v for k, v in unique.items() if v.ats == "linkedin"}
+
+        logger.info("  ATS companies (with API URLs): %d", len(ats_companies))
+        logger.info("  LinkedIn-only companies (need probing): %d", len(linkedin_companies))
+
+        # Print ATS breakdown
+        ats_counts = Counter(c.ats for c in ats_companies.values())
+        for ats, count in ats_counts.most_common():
+            logger.info("    %s: %d", ats, count)
+
+        if dry_run:
+            logger.info("DRY RUN — not writing to database")
+            _print_sample(ats_companies, linkedin_companies)
+            return
+
+        # -------------------------------------------------------------------
+        # Phase 2: Upsert the remaining companies to Supabase
+        # -------------------------------------------------------------------
+        # LinkedIn company names go in unverified, with no API URL; they are
+        # probed by discover_companies.py later
+        write_companies([key for key in unique if key not in written])
+
+        # Every key was written exactly once, so each row is one company
+        upserted = sum(len(f.result()) for f in ats_writes)
+        errors = len(ats_companies) - upserted
+        logger.info("Upserted %d ATS companies (%d errors)", upserted, errors)
+
+        linkedin_upserted = sum(len(f.result()) for f in linkedin_writes)
+        logger.info("Upserted %d LinkedIn company references", linkedin_upserted)
+
+        # -------------------------------------------------------------------
+        # Phase 3: Optionally seed jobs
+        # -------------------------------------------------------------------
+        new_jobs = 0
+        if seed_jobs:
+            logger.info("Seeding jobs from result files...")
+            logger.info("Total jobs to seed: %d", job_count)
+
+            if pending_jobs:
+                job_writes.append(db_pool.submit(db.batch_insert_jobs, pending_jobs))
+            new_jobs = sum(f.result()[0] for f in job_writes)
+
+            logger.info("Seeded %d new jobs", new_jobs)
+    except BaseException:
+        # The run was started before extraction, so don't leave it 'running'
+        if run_id is not None:
+            db.finish_scrape_run(run_id=run_id, errors=1, status="failed")
+        raise
+    finally:
+        if db_pool is not None:
+            db_pool.shutdown(wait=True)
 
     # -----------------------------------------------------------------------
     # Finish
@@ -594,13 +721,29 @@ def seed_companies(
         status="completed",
     )
 
-    total_companies = db.get_company_count()
-    total_jobs = db.get_job_count(active_only=False)
+    total_companies, total_jobs = db.fetch_concurrently(
+        db.get_company_count,
+        lambda: db.get_job_count(active_only=False),
+    )
     logger.info("=== SEED COMPLETE ===")
     logger.info("Total companies in DB: %d", total_companies)
     logger.info("Total jobs in DB: %d", total_jobs)
 
 
+def _company_row(company: ExtractedCompany) -> dict[str, Any]:
+    """db.upsert_companies row for an extracted company."""
+    row: dict[str, Any] = {
+        "slug": company.slug,
+        "ats": company.ats,
+        "name": company.name,
+        "careers_url": company.careers_url,
+        "source": f"seed:{company.source_file}",
+    }
+    if company.ats != "linkedin":
+        row["api_url"] = generate_api_url(company.ats, company.slug)
+    return row
+
+
 def _print_sample(
     ats_companies: dict[str, ExtractedCompany],
     linkedin_companies: dict[str, ExtractedCompany],
@@ -646,6 +789,11 @@ def main() -> None:
         action="store_true",
         help="Also seed jobs from result files (not just companies)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-extract every file instead of reusing cached results for unchanged files",
+    )
 
     args = parser.parse_args()
 
@@ -658,6 +806,7 @@ def main() -> None:
         file_glob=args.glob,
         dry_run=args.dry_run,
         seed_jobs=args.seed_jobs,
+        use_cache=not args.no_cache,
     )
 
 
@@ -0,0 +1,32 @@
+-- ============================================================================
+-- SYKR — upsert_job RPC
+-- Insert a job or refresh an existing one (matched on url_hash) in a single
+-- round trip. Called by backend/db.py upsert_job().
+-- ============================================================================
+
+-- p_job is a jobs row as JSON. Returns the stored row plus whether it was
+-- inserted (xmax = 0) or already existed. On conflict only the fields a
+-- re-scrape may change are touched; first_seen is kept.
+CREATE OR REPLACE FUNCTION public.upsert_job(p_job jsonb)
+RETURNS TABLE (job jsonb, is_new boolean) AS $$
+    INSERT INTO jobs AS j (
+        url_hash, url, title, ats_source, company_name, company_id, location,
+        description, salary_min, salary_max, remote_type, seniority, platform,
+        category, tags, easy_apply, posted_at, raw_data,
+        first_seen, last_seen, is_active
+    )
+    SELECT
+        r.url_hash, r.url, r.title, r.ats_source, r.company_name, r.company_id, r.location,
+        r.description, r.salary_min, r.salary_max, COALESCE(r.remote_type, 'unknown'),
+        r.seniority, r.platform, r.category, COALESCE(r.tags, '{}'),
+        COALESCE(r.easy_apply, false), r.posted_at, COALESCE(r.raw_data, '{}'),
+        COALESCE(r.first_seen, now()), COALESCE(r.last_seen, now()), true
+    FROM jsonb_populate_record(NULL::jobs, p_job) AS r
+    ON CONFLICT (url_hash) DO UPDATE SET
+        last_seen  = EXCLUDED.last_seen,
+        is_active  = true,
+        company_id = COALESCE(EXCLUDED.company_id, j.company_id),
+        salary_min = COALESCE(EXCLUDED.salary_min, j.salary_min),
+        salary_max = COALESCE(EXCLUDED.salary_max, j.salary_max)
+    RETURNING to_jsonb(j), (j.xmax = 0);
+$$ LANGUAGE sql;
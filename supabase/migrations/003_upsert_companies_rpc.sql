@@ -0,0 +1,29 @@
+-- ============================================================================
+-- SYKR — upsert_companies RPC
+-- Insert or update companies by (ats, slug) and merge their source tags in
+-- one statement. Called by backend/db.py upsert_company().
+-- ============================================================================
+
+-- p_companies is a JSON array of companies rows. Each may carry "sources"
+-- (usually a single tag); tags missing from the stored row are appended in
+-- order. On conflict, fields left out of a row keep their stored values.
+-- Rows must be unique on (ats, slug) within one call.
+CREATE OR REPLACE FUNCTION public.upsert_companies(p_companies jsonb)
+RETURNS SETOF companies AS $$
+    INSERT INTO companies AS c (slug, ats, name, api_url, careers_url, metadata, sources)
+    SELECT
+        r.slug, r.ats, r.name, r.api_url, r.careers_url,
+        COALESCE(r.metadata, '{}'), COALESCE(r.sources, '{}')
+    FROM jsonb_populate_recordset(NULL::companies, p_companies) AS r
+    ON CONFLICT (ats, slug) DO UPDATE SET
+        name        = COALESCE(EXCLUDED.name, c.name),
+        api_url     = COALESCE(EXCLUDED.api_url, c.api_url),
+        careers_url = COALESCE(EXCLUDED.careers_url, c.careers_url),
+        metadata    = CASE WHEN EXCLUDED.metadata = '{}'::jsonb
+                           THEN c.metadata ELSE EXCLUDED.metadata END,
+        sources     = COALESCE(c.sources, '{}') || ARRAY(
+            SELECT s FROM unnest(EXCLUDED.sources) AS s
+            WHERE s <> ALL (COALESCE(c.sources, '{}'))
+        )
+    RETURNING c.*;
+$$ LANGUAGE sql;
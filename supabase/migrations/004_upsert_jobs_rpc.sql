@@ -0,0 +1,34 @@
+-- ============================================================================
+-- SYKR — upsert_jobs RPC
+-- Batch insert-or-refresh for scraped jobs: one statement (and one
+-- transaction) per call. Called by backend/db.py batch_insert_jobs().
+-- ============================================================================
+
+-- p_jobs is a JSON array of jobs rows. New url_hashes are inserted; rows
+-- that already exist get last_seen refreshed, are re-activated, and have
+-- company_id/salary backfilled when the new row has them (as upsert_job).
+-- Duplicate url_hashes within one call are collapsed, since ON CONFLICT
+-- DO UPDATE can't touch the same row twice in a statement.
+CREATE OR REPLACE FUNCTION public.upsert_jobs(p_jobs jsonb)
+RETURNS TABLE (job_url_hash text, is_new boolean) AS $$
+    INSERT INTO jobs AS j (
+        url_hash, url, title, ats_source, company_name, company_id, location,
+        description, salary_min, salary_max, remote_type, seniority, platform,
+        category, tags, easy_apply, posted_at, raw_data,
+        first_seen, last_seen, is_active
+    )
+    SELECT DISTINCT ON (r.url_hash)
+        r.url_hash, r.url, r.title, r.ats_source, r.company_name, r.company_id, r.location,
+        r.description, r.salary_min, r.salary_max, COALESCE(r.remote_type, 'unknown'),
+        r.seniority, r.platform, r.category, COALESCE(r.tags, '{}'),
+        COALESCE(r.easy_apply, false), r.posted_at, COALESCE(r.raw_data, '{}'),
+        COALESCE(r.first_seen, now()), COALESCE(r.last_seen, now()), true
+    FROM jsonb_populate_recordset(NULL::jobs, p_jobs) AS r
+    ON CONFLICT (url_hash) DO UPDATE SET
+        last_seen  = EXCLUDED.last_seen,
+        is_active  = true,
+        company_id = COALESCE(EXCLUDED.company_id, j.company_id),
+        salary_min = COALESCE(EXCLUDED.salary_min, j.salary_min),
+        salary_max = COALESCE(EXCLUDED.salary_max, j.salary_max)
+    RETURNING j.url_hash, (j.xmax = 0);
+$$ LANGUAGE sql;
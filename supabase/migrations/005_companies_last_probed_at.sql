@@ -0,0 +1,8 @@
+-- ============================================================================
+-- SYKR — companies.last_probed_at
+-- When discover_companies.py last got a definitive answer (board found or
+-- not) for an unverified company. Companies probed within
+-- PROBE_RECHECK_HOURS are skipped on the next run.
+-- ============================================================================
+
+ALTER TABLE companies ADD COLUMN IF NOT EXISTS last_probed_at TIMESTAMPTZ;